@@ -0,0 +1,86 @@
+"""Measure how much memory sprites use and how long writing their attributes takes.
+
+Run it from the root of the repository:
+
+    python benchmarks/sprite_attributes.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+sys.path.insert(0, ".")
+
+import play  # pylint: disable=wrong-import-position
+
+COUNT = 10_000
+ROUNDS = 5
+
+
+def measure_memory():
+    """Make COUNT boxes and measure the Python memory each one takes.
+    :return: The list of boxes and the number of bytes per box."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    boxes = [play.new_box(width=10, height=10) for _ in range(COUNT)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return boxes, used / COUNT
+
+
+def measure_writes(boxes, write):
+    """Time writing an attribute of every box, keeping the fastest round.
+    :param boxes: The boxes to write to.
+    :param write: A function that writes an attribute of a box and a number.
+    :return: The number of nanoseconds per write."""
+    best = float("inf")
+    for round_ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        for box in boxes:
+            write(box, round_)
+        best = min(best, time.perf_counter_ns() - start)
+    return best / len(boxes)
+
+
+def set_x(box, value):
+    """Move a box, a write of a public attribute that changes its value."""
+    box.x = value
+
+
+def set_same_color(box, _):
+    """Give a box the color it already has."""
+    box.color = "black"
+
+
+def set_rect(box, _):
+    """Write the rect of a box, like update() does."""
+    box.rect = box.rect
+
+
+def set_clicked(box, value):
+    """Write an internal attribute, like the game loop does every frame."""
+    box._is_clicked = bool(value)  # pylint: disable=protected-access
+
+
+def main():
+    """Print the memory per box and the time per write."""
+    boxes, bytes_per_box = measure_memory()
+    has_dict = hasattr(boxes[0], "__dict__") and bool(vars(boxes[0]))
+    print(f"{COUNT} boxes")
+    print(f"  memory per box:              {bytes_per_box:8.0f} bytes")
+    print(f"  attributes in __dict__:      {len(vars(boxes[0])) if has_dict else 0:8d}")
+    for name, write in [
+        ("box.x = <new value>", set_x),
+        ("box.color = <same value>", set_same_color),
+        ("box.rect = <internal>", set_rect),
+        ("box._is_clicked = <internal>", set_clicked),
+    ]:
+        print(f"  {name:29s}{measure_writes(boxes, write):8.0f} ns per write")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Measure how long a sprite takes to check if it touches one of many other sprites.
+
+A player checks if it touches any of 100, 1,000 or 10,000 coins spread over a
+large level, with the grid of nearby sprites and without it. Run it from the
+root of the repository:
+
+    python benchmarks/touching.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+sys.path.insert(0, ".")
+
+import play  # pylint: disable=wrong-import-position
+from play.utils.spatial_grid import (  # pylint: disable=wrong-import-position
+    sprite_grid,
+)
+
+SIZES = (100, 1_000, 10_000)
+LEVEL = 4_000
+ROUNDS = 200
+
+
+def measure_update(player):
+    """Time updating a moving player, keeping the fastest of a few runs.
+    :param player: The sprite that checks if it touches the coins.
+    :return: The number of microseconds per update."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        for step in range(ROUNDS):
+            player.x = step % 2
+            player.update()
+        best = min(best, time.perf_counter_ns() - start)
+    return best / ROUNDS / 1000
+
+
+def make_level(size):
+    """Make a player and coins spread over the level, replacing the last level.
+    :param size: The number of coins.
+    :return: The player, which checks if it touches any coin."""
+    for sprite in play.globals.globals_list.sprites_group.sprites():
+        sprite.remove()
+    player = play.new_box(x=0, y=0, width=20, height=20)
+    coins = [
+        play.new_circle(
+            x=random.uniform(-LEVEL / 2, LEVEL / 2),
+            y=random.uniform(-LEVEL / 2, LEVEL / 2),
+            radius=5,
+        )
+        for _ in range(size)
+    ]
+
+    @player.when_touching(*coins)
+    def collect():
+        pass
+
+    return player
+
+
+def main():
+    """Print the time per update of the player, with and without the grid."""
+    random.seed(1)
+    print(f"{'coins':>8} {'without grid':>14} {'with grid':>12} {'speedup':>8}")
+    for size in SIZES:
+        player = make_level(size)
+        sprite_grid.enabled = False
+        without_grid = measure_update(player)
+        sprite_grid.enabled = True
+        with_grid = measure_update(player)
+        print(
+            f"{size:8d} {without_grid:11.1f} us {with_grid:9.1f} us"
+            f" {without_grid / with_grid:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
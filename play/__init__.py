@@ -3,8 +3,11 @@
 import pygame
 
 from .api import *
+from .io.assets import image_assets
 from .io.controllers import controllers
 from .io.mouse import mouse
 from .io.screen import screen
+from .utils.stats import stats
+from .utils.surface_cache import surface_cache
 
 pygame.init()
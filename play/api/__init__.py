@@ -8,12 +8,17 @@ from .generators import (
     new_circle,
     new_line,
     new_image,
+    new_sprite_batch,
+    new_emitter,
+    new_group,
     new_sound,
     new_database,
 )
 from .events import (
     when_program_starts,
     repeat_forever,
+    every,
+    after,
     when_sprite_clicked,
     when_any_key_pressed,
     when_key_pressed,
@@ -21,15 +26,27 @@ from .events import (
     when_key_released,
     when_mouse_clicked,
     when_click_released,
+    before_each_frame,
+    after_each_frame,
 )
 from .utils import (
     start_program,
     stop_program,
+    step_frames,
     animate,
+    frame_count,
     set_backdrop,
     set_backdrop_image,
     timer,
     key_is_pressed,
     set_physics_simulation_steps,
+    set_adaptive_physics_steps,
+    set_fixed_timestep,
+    set_frame_rate,
+    set_power_saving,
+    set_renderer,
+    set_culling,
+    set_click_mode,
+    preload_images,
 )
 from .random import random_number, random_color, random_position
@@ -1,13 +1,17 @@
 """All the events that can be triggered in the game."""
 
+import asyncio as _asyncio
+
 from ..callback import callback_manager, CallbackType
+from ..core.frame_driver import frame_driver as _frame_driver
+from ..core.timer_wheel import timer_wheel as _timer_wheel
 from ..io.keypress import (
     when_key as _when_key,
     when_any_key as _when_any_key,
 )
 from ..io.mouse import mouse
 from ..utils.async_helpers import make_async
-from ..callback.callback_helpers import run_async_callback
+from ..callback.callback_helpers import run_async_callback, run_callback
 
 
 # @decorator
@@ -72,6 +76,82 @@ def repeat_forever(func):
     return func
 
 
+# @decorator
+def every(seconds):
+    """
+    Calls the given function every number of seconds, counted on the frame clock.
+    If the function is still running when it's time again, that time is skipped.
+
+    Example:
+
+        @play.every(2)
+        def spawn():
+            play.new_circle(x=play.random_number(-200, 200))
+
+    :param seconds: The number of seconds between calls.
+    :return: The decorator function.
+    """
+    if seconds <= 0:
+        raise ValueError("seconds must be a positive number.")
+
+    def decorator(func):
+        async_callback = make_async(func)
+
+        async def every_wrapper():
+            try:
+                await run_async_callback(
+                    async_callback,
+                    [],
+                    [],
+                )
+            finally:
+                every_wrapper.is_running = False
+
+        def fire():
+            _timer_wheel.schedule(seconds, fire)
+            if not every_wrapper.is_running:
+                # set before the task starts, so the next time can't start it again
+                every_wrapper.is_running = True
+                run_callback(every_wrapper, [], [])
+
+        every_wrapper.is_running = False
+        _timer_wheel.schedule(seconds, fire)
+        return func
+
+    return decorator
+
+
+# @decorator
+def after(seconds):
+    """
+    Calls the given function once, a number of seconds from now, counted on the frame clock.
+
+    Example:
+
+        @play.after(3)
+        def hide_title():
+            title.hide()
+
+    :param seconds: The number of seconds to wait.
+    :return: The decorator function.
+    """
+
+    def decorator(func):
+        async_callback = make_async(func)
+
+        async def after_wrapper():
+            await run_async_callback(
+                async_callback,
+                [],
+                [],
+            )
+
+        _timer_wheel.schedule(seconds, run_callback, after_wrapper, [], [])
+        return func
+
+    return decorator
+
+
 # @decorator
 def when_sprite_clicked(*sprites):
     """A decorator that runs a function when a sprite is clicked.
@@ -192,3 +272,42 @@ def when_click_released(func):
             text.words = 'mouse click released'
     """
     return mouse.when_click_released(func)
+
+
+def _add_frame_hook(when, func):
+    if _asyncio.iscoroutinefunction(func):
+        raise ValueError(
+            "Frame hooks run in the middle of drawing a frame and can't be async functions."
+        )
+    _frame_driver.add_hook(when, func)
+    return func
+
+
+# @decorator
+def before_each_frame(func):
+    """
+    Calls the given function at the start of every frame, before any other callback.
+    The function can't be async and should be quick, the frame waits for it.
+
+    Example:
+
+        @play.before_each_frame
+        def count():
+            print(play.frame_count())
+    """
+    return _add_frame_hook("before_frame", func)
+
+
+# @decorator
+def after_each_frame(func):
+    """
+    Calls the given function right after every frame is shown on the screen.
+    The function can't be async and should be quick, the frame waits for it.
+
+    Example:
+
+        @play.after_each_frame
+        def count():
+            print(play.frame_count())
+    """
+    return _add_frame_hook("after_frame", func)
@@ -8,6 +8,9 @@ from ..objects import (
     Text as _Text,
     Image as _Image,
     Sound as _Sound,
+    SpriteBatch as _SpriteBatch,
+    Emitter as _Emitter,
+    Group as _Group,
 )
 
 
@@ -189,6 +192,116 @@ def new_image(
     )
 
 
+def new_sprite_batch(
+    shape: str = "circle",
+    count: int = 100,
+    color: str = "black",
+    radius: int = 10,
+    width: int = 10,
+    height: int = 10,
+    x: int = 0,
+    y: int = 0,
+    angle: int = 0,
+    transparency: int = 100,
+) -> _SpriteBatch:
+    """Make a batch of many sprites of the same shape, stored in NumPy arrays.
+    :param shape: Either "circle" or "box".
+    :param count: The number of sprites in the batch.
+    :param color: The color of every sprite, change batch.colors to give them their own colors.
+    :param radius: The radius of the circles.
+    :param width: The width of the boxes.
+    :param height: The height of the boxes.
+    :param x: The x-coordinate of every sprite.
+    :param y: The y-coordinate of every sprite.
+    :param angle: The angle of every box.
+    :param transparency: The transparency of the sprites.
+    :return: A new sprite batch.
+    """
+    return _SpriteBatch(
+        shape=shape,
+        count=count,
+        color=color,
+        radius=radius,
+        width=width,
+        height=height,
+        x=x,
+        y=y,
+        angle=angle,
+        transparency=transparency,
+    )
+
+
+def new_emitter(  # pylint: disable=too-many-arguments, too-many-locals
+    x: int = 0,
+    y: int = 0,
+    rate: float = 50,
+    lifetime: float = 1,
+    speed: float = 100,
+    speed_spread: float = 0,
+    direction: float = 90,
+    spread: float = 360,
+    gravity: float = 0,
+    color: str = "black",
+    end_color: str = None,
+    transparency: int = 100,
+    end_transparency: int = 0,
+    radius: int = 3,
+    image: str = None,
+    max_particles: int = 1000,
+) -> _Emitter:
+    """Make a new particle emitter.
+    :param x: The x-coordinate the particles start at.
+    :param y: The y-coordinate the particles start at.
+    :param rate: The number of particles sent out per second.
+    :param lifetime: The number of seconds a particle lives.
+    :param speed: The speed of the particles, in pixels per second.
+    :param speed_spread: How much the speed differs between particles, 0.5 is up to 50% faster or slower.
+    :param direction: The angle the particles move towards, 90 is up.
+    :param spread: The number of degrees around the direction the particles spread over.
+    :param gravity: How fast particles fall, in pixels per second per second.
+    :param color: The color of a new particle.
+    :param end_color: The color of a particle at the end of its life, the same as color if None.
+    :param transparency: The transparency of a new particle.
+    :param end_transparency: The transparency of a particle at the end of its life.
+    :param radius: The radius of the particles.
+    :param image: An image file to draw the particles with instead of circles.
+    :param max_particles: The most particles alive at once, the oldest ones make room for new ones.
+    :return: A new emitter.
+    """
+    return _Emitter(
+        x=x,
+        y=y,
+        rate=rate,
+        lifetime=lifetime,
+        speed=speed,
+        speed_spread=speed_spread,
+        direction=direction,
+        spread=spread,
+        gravity=gravity,
+        color=color,
+        end_color=end_color,
+        transparency=transparency,
+        end_transparency=end_transparency,
+        radius=radius,
+        image=image,
+        max_particles=max_particles,
+    )
+
+
+def new_group(*sprites) -> _Group:
+    """Make a new group of sprites, like all coins or all enemies.
+    A sprite can run an event when it touches any sprite of the group:
+
+        @player.when_touching(coins)
+        def collect(coin):
+            coin.remove()
+
+    :param sprites: The sprites that start in the group.
+    :return: A new group.
+    """
+    return _Group(*sprites)
+
+
 def new_sound(
     file_name: str = "file.mp3",
     volume: float = 1.0,
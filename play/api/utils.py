@@ -1,17 +1,34 @@
 """Game functions and utilities."""
 
-import asyncio as _asyncio
 import logging as _logging
 
 import pygame  # pylint: disable=import-error
 
 from ..callback import callback_manager, CallbackType
-from ..core import game_loop as _game_loop
+from ..core import game_loop as _game_loop, step_frames as _step_frames
+from ..core.frame_driver import frame_driver as _frame_driver
+from ..core.mouse_loop import mouse_state as _mouse_state, CLICK_MODES as _CLICK_MODES
+from ..core.physics_loop import fixed_timestep_state as _fixed_timestep_state
+from ..core.renderer import renderer as _renderer
+from ..core.timer_wheel import timer_wheel as _timer_wheel
 from ..globals import globals_list
+from ..io.assets import image_assets as _image_assets
 from ..io.keypress import keyboard_state
+from ..io.viewport import viewport as _viewport
 from ..loop import loop as _loop
-from ..physics import set_physics_simulation_steps as _set_physics_simulation_steps
+from ..physics import (
+    set_physics_simulation_steps as _set_physics_simulation_steps,
+    set_fixed_timestep as _set_fixed_timestep,
+    set_adaptive_physics_steps as _set_adaptive_physics_steps,
+)
 from ..utils import color_name_to_rgb as _color_name_to_rgb
+from ..utils.scene import scene as _scene
+
+
+def _start_callbacks():
+    if not _frame_driver.started:
+        _frame_driver.started = True
+        callback_manager.run_callbacks(CallbackType.WHEN_PROGRAM_START)
 
 
 def start_program():
@@ -20,7 +37,7 @@ def start_program():
 
     play.start_program() should almost certainly go at the very end of your program.
     """
-    callback_manager.run_callbacks(CallbackType.WHEN_PROGRAM_START)
+    _start_callbacks()
 
     _loop.create_task(_game_loop())
     try:
@@ -37,16 +54,63 @@ def stop_program():
 
     play.stop_program() should almost certainly go at the very end of your program.
     """
+    _frame_driver.running = False
     _loop.stop()
     pygame.display.quit()
     pygame.quit()  # pylint: disable=no-member
 
 
-async def animate():
+def step_frames(num_frames: int = 1, dt: float | None = None) -> int:
+    """
+    Run the game for a number of frames as fast as the computer can, then return.
+    Nothing waits for the clock, so this is useful for tests and simulations.
+    Set the PLAY_HEADLESS=1 environment variable to run without opening a window.
+
+    Example:
+
+        ball = play.new_circle()
+        ball.start_physics(x_speed=60, obeys_gravity=False)
+        play.step_frames(60)
+        print(ball.x)  # about 60
+
+    :param num_frames: The number of frames to run.
+    :param dt: The number of seconds each frame takes. Defaults to 1 / frame rate.
+    :return: The number of frames that were run, fewer if the program was stopped.
+    """
+    _start_callbacks()
+    first_frame = _frame_driver.frame_count
+    try:
+        return _loop.run_until_complete(_step_frames(num_frames, dt))
+    except RuntimeError:
+        # play.stop_program() stops the event loop in the middle of stepping
+        if _frame_driver.running:
+            raise
+        return _frame_driver.frame_count - first_frame
+
+
+def frame_count():
+    """
+    Returns the number of frames drawn since the program started.
+    """
+    return _frame_driver.frame_count
+
+
+async def animate(frames: int = 1):
     """
     Wait for the next frame to be drawn.
+
+    Example:
+
+        @play.when_program_starts
+        async def spin():
+            while True:
+                box.turn(1)
+                await play.animate()
+
+    :param frames: The number of frames to wait for.
     """
-    await _asyncio.sleep(0)
+    for _ in range(frames):
+        await _frame_driver.next_frame()
 
 
 def set_backdrop(color):
@@ -54,22 +118,35 @@ def set_backdrop(color):
     :param color: The color or image to set as the backdrop.
     """
     globals_list.backdrop = _color_name_to_rgb(color)
+    _scene.mark_dirty()
 
 
 def set_backdrop_image(image):
     """Set the backdrop image for the game.
     :param image: The image to set as the backdrop.
     """
-    globals_list.backdrop = pygame.image.load(image)
+    globals_list.backdrop = _image_assets.load(image)
     globals_list.backdrop_type = "image"
+    _scene.mark_dirty()
+
+
+def _resolve_timer(future):
+    if not future.done():
+        future.set_result(True)
 
 
 async def timer(seconds=1.0):
     """Wait a number of seconds. Used with the await keyword like this:
+
+        await play.timer(seconds=2)
+
+    The time is counted on the frame clock, so the timer always ends between two frames.
     :param seconds: The number of seconds to wait.
     :return: True after the number of seconds has passed.
     """
-    await _asyncio.sleep(seconds)
+    future = _loop.create_future()
+    _timer_wheel.schedule(seconds, _resolve_timer, future)
+    await future
     return True
 
 
@@ -96,3 +173,116 @@ def set_physics_simulation_steps(num_steps: int) -> None:
     :param num_steps: The number of simulation steps.
     """
     _set_physics_simulation_steps(num_steps)
+
+
+def set_adaptive_physics_steps(max_steps: int = 10, enabled: bool = True) -> None:
+    """
+    Let the physics engine pick the number of simulation steps every frame,
+    instead of always using the number set with set_physics_simulation_steps.
+    Scenes with slow objects then use a single step, fast objects get more.
+    :param max_steps: The maximum number of simulation steps per frame.
+    :param enabled: Whether the number of steps is picked automatically.
+    """
+    _set_adaptive_physics_steps(max_steps, enabled)
+
+
+def set_fixed_timestep(
+    physics_rate: int = 60, max_steps_per_frame: int = 5, enabled: bool = True
+) -> None:
+    """
+    Run the physics at a constant rate, no matter how fast the frames are drawn.
+    A slow frame is caught up on with extra physics ticks, up to max_steps_per_frame.
+
+    Example:
+
+        play.set_frame_rate(120)
+        play.set_fixed_timestep(physics_rate=60)
+
+    :param physics_rate: The number of physics ticks per second.
+    :param max_steps_per_frame: The maximum number of catch-up ticks in a single frame.
+    :param enabled: Whether the fixed timestep is used.
+    """
+    changed = (enabled, physics_rate) != (
+        globals_list.fixed_timestep,
+        globals_list.physics_rate,
+    )
+    _set_fixed_timestep(physics_rate, max_steps_per_frame, enabled)
+    # time left over from the old ticks would be caught up on in a burst
+    if changed:
+        _fixed_timestep_state.clear()
+
+
+def set_frame_rate(frame_rate: int) -> None:
+    """
+    Set the maximum number of frames drawn per second.
+    :param frame_rate: The number of frames per second.
+    """
+    if frame_rate <= 0:
+        raise ValueError("frame_rate must be a positive number.")
+    globals_list.FRAME_RATE = frame_rate
+
+
+def set_power_saving(
+    enabled: bool = True, idle_frame_rate: int = 5, pause_when_idle: bool = False
+) -> None:
+    """
+    Save power while the window is unfocused, minimized or hidden.
+    While the window is unfocused the game only draws idle_frame_rate frames per second,
+    while it is minimized or hidden nothing is drawn at all.
+    :param enabled: Whether to save power while the window is idle.
+    :param idle_frame_rate: The number of frames per second while the window is idle.
+    :param pause_when_idle: If True, physics and timers stand still while the window is idle.
+    """
+    if idle_frame_rate <= 0:
+        raise ValueError("idle_frame_rate must be a positive number.")
+    globals_list.power_saving = enabled
+    globals_list.idle_frame_rate = idle_frame_rate
+    globals_list.pause_when_idle = pause_when_idle
+
+
+def set_renderer(name: str) -> None:
+    """
+    Choose how frames are drawn on the screen.
+    "full" draws the whole screen every frame, "dirty" only draws the parts of the screen
+    where sprites moved or changed, which is faster when most of the screen stays the same.
+    :param name: Either "full" or "dirty".
+    """
+    _renderer.set_mode(name)
+
+
+def set_culling(enabled: bool = True, margin: int = 0) -> None:
+    """
+    Skip the sprites that are outside the screen, for games with large levels.
+    Sprites outside the screen aren't drawn, and changing how they look is only drawn
+    once they come back on the screen. Their events and physics keep working.
+    play.stats.counts["sprites_drawn"] and ["sprites_culled"] count them every frame.
+    :param enabled: Whether sprites outside the screen are skipped.
+    :param margin: How many pixels outside the screen sprites still count as visible.
+    """
+    if margin < 0:
+        raise ValueError("margin can't be negative.")
+    _viewport.culling = enabled
+    _viewport.margin = margin
+    _scene.mark_dirty()
+
+
+def set_click_mode(mode: str) -> None:
+    """
+    Choose which sprites a click goes to when sprites overlap.
+    :param mode: "all" to click every sprite under the mouse pointer (the default), or
+        "topmost" to click only the sprite drawn on top, like buttons in a menu.
+    """
+    if mode not in _CLICK_MODES:
+        raise ValueError(
+            f"Unknown click mode {mode!r}. Use one of: {', '.join(_CLICK_MODES)}."
+        )
+    _mouse_state.click_mode = mode
+
+
+def preload_images(paths) -> None:
+    """
+    Load image files before they are needed, for example while showing a title screen.
+    Every image file is only loaded once, no matter how many sprites use it.
+    :param paths: A list of paths of image files.
+    """
+    _image_assets.preload(paths)
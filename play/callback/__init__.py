@@ -23,6 +23,8 @@ class CallbackType(Enum):
     WHEN_CONTROLLER_BUTTON_RELEASED = 12
     WHEN_CONTROLLER_AXIS_MOVED = 13
     WHEN_RESIZED = 14
+    WHEN_MOUSE_OVER_SPRITE = 15
+    WHEN_MOUSE_LEAVE_SPRITE = 16
 
 
 class CallbackManager:
@@ -21,8 +21,38 @@ class CollisionCallbackRegistry:  # pylint: disable=too-few-public-methods
     A registry for collision callbacks.
     """
 
+    def _begin(self, shape, callback):
+        """Start running the touching callback of the sprite of a shape every frame.
+        :param shape: The shape of the sprite that is touching.
+        :param callback: The callback to run."""
+        sprite = self.shape_registry[shape.collision_type]
+        sprite._touching_callback[shape.collision_id] = callback
+        # the collision might end in a later physics step of the same frame, so
+        # remember that it began until the sprites ran their events. It can also
+        # begin again in that frame, the callback still runs once.
+        self._began.setdefault(sprite, {})[callback] = None
+
+    def began(self, sprite):
+        """Get the touching callbacks of a sprite whose collision began this frame.
+        :param sprite: The sprite.
+        :return: A list of callbacks."""
+        return list(self._began.get(sprite, {}))
+
+    def touched(self, shape_a, shape_b):
+        """Check if two shapes touched in one of the physics steps of this frame.
+        :param shape_a: The first shape.
+        :param shape_b: The second shape.
+        :return: Whether the shapes touched."""
+        return frozenset((shape_a, shape_b)) in self._touched
+
+    def end_frame(self):
+        """Forget the collisions of this frame, after the sprites ran their events."""
+        self._began = {}
+        self._touched = set()
+
     def _handle_collision(self, arbiter, _, __):
         shape_a, shape_b = arbiter.shapes
+        self._touched.add(frozenset((shape_a, shape_b)))
         if shape_a.collision_type == 0 or shape_b.collision_type == 0:
             return True
 
@@ -33,9 +63,7 @@ class CollisionCallbackRegistry:  # pylint: disable=too-few-public-methods
             callback = self.callbacks[True][shape_a.collision_type][
                 shape_b.collision_type
             ]
-            self.shape_registry[shape_a.collision_type]._touching_callback[
-                shape_a.collision_id
-            ] = callback
+            self._begin(shape_a, callback)
 
         if (
             shape_b.collision_type in self.callbacks[True]
@@ -44,9 +72,7 @@ class CollisionCallbackRegistry:  # pylint: disable=too-few-public-methods
             callback = self.callbacks[True][shape_b.collision_type][
                 shape_a.collision_type
             ]
-            self.shape_registry[shape_b.collision_type]._touching_callback[
-                shape_b.collision_id
-            ] = callback
+            self._begin(shape_b, callback)
         return True
 
     def _handle_end_collision(self, arbiter, _, __):
@@ -99,6 +125,8 @@ class CollisionCallbackRegistry:  # pylint: disable=too-few-public-methods
     def __init__(self):
         self.callbacks = {True: {}, False: {}}
         self.shape_registry = {}
+        self._began = {}
+        self._touched = set()
         handler: CollisionHandler = physics_space.add_default_collision_handler()
         handler.begin = self._handle_collision
         handler.separate = self._handle_end_collision
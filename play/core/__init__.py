@@ -1,12 +1,17 @@
 """Core game loop and event handling functions."""
 
+import asyncio as _asyncio
+from time import perf_counter as _perf_counter
+
 import pygame
+import pymunk as _pymunk
 
 from .controller_loop import (
     controller_state,
     handle_controller as _handle_controller,
     handle_controller_events as _handle_controller_events,
 )
+from .frame_driver import frame_driver
 from .game_loop_wrapper import listen_to_failure
 from .keyboard_loop import (
     handle_keyboard as _handle_keyboard,
@@ -17,12 +22,21 @@ from .mouse_loop import (
     handle_mouse_events as _handle_mouse_events,
     mouse_state,
 )
-from .physics_loop import simulate_physics
+from .renderer import renderer
+from .physics_loop import simulate_physics, simulate_fixed_physics
 from .sprites_loop import update_sprites as _update_sprites
+from .timer_wheel import timer_wheel
+from .window_loop import (
+    handle_window_events as _handle_window_events,
+    window_state,
+)
 from ..callback import callback_manager, CallbackType
 from ..globals import globals_list
 from ..io.screen import screen
 from ..loop import loop as _loop
+from ..physics import physics_space
+from ..utils.scene import scene
+from ..utils.stats import stats
 from ..io.keypress import keyboard_state
 
 _clock = pygame.time.Clock()
@@ -48,6 +62,7 @@ def _handle_pygame_events():
         _handle_keyboard_events(event)
         _handle_mouse_events(event)
         _handle_controller_events(event)
+        _handle_window_events(event)
 
         if event.type == pygame.WINDOWRESIZED:
             screen.width, screen.height = event.w, event.h
@@ -57,52 +72,191 @@ def _handle_pygame_events():
             globals_list.backdrop = pygame.transform.smoothscale(
                 globals_list.backdrop, (screen.width, screen.height)
             )
+            scene.mark_dirty()
             callback_manager.run_callbacks(CallbackType.WHEN_RESIZED)
 
     return True
 
 
-@listen_to_failure()
-async def game_loop():
-    """The main game loop."""
-    keyboard_state.clear()
-    mouse_state.clear()
-    controller_state.clear()
-
-    _clock.tick(globals_list.FRAME_RATE)
+async def _events_phase():
+    """Collect the pygame events of this frame.
+    :return: False if the program should stop."""
+    return _handle_pygame_events()
 
-    if not _handle_pygame_events():
-        return
 
+async def _keyboard_phase():
+    """Run the keyboard callbacks."""
     await _handle_keyboard()
 
-    if mouse_state.click_happened or mouse_state.click_release_happened:
+
+async def _mouse_phase():
+    """Run the mouse callbacks."""
+    if (
+        mouse_state.click_happened
+        or mouse_state.click_release_happened
+        or mouse_state.mouse_moved
+    ):
         await _handle_mouse_loop()
 
+
+async def _controller_phase():
+    """Run the controller callbacks."""
     if controller_state.any():
         await _handle_controller()
 
-    #############################
-    # @repeat_forever callbacks
-    #############################
+
+async def _repeat_forever_phase():
+    """Run the @repeat_forever callbacks."""
     callback_manager.run_callbacks(CallbackType.REPEAT_FOREVER)
 
-    #############################
-    # physics simulation
-    #############################
-    await simulate_physics()
-
-    if globals_list.backdrop_type == "color":
-        globals_list.display.fill(globals_list.backdrop)
-    elif globals_list.backdrop_type == "image":
-        globals_list.display.blit(
-            globals_list.backdrop,
-            (0, 0),
+
+async def _physics_phase():
+    """Advance the physics simulation."""
+    stats.set_count("physics_bodies", len(physics_space.bodies))
+    if window_state.paused:
+        return
+    if globals_list.fixed_timestep:
+        await simulate_fixed_physics(frame_driver.frame_time)
+    elif window_state.idle:
+        # idle frames are further apart, so physics steps by the time that passed
+        # to keep up with the timers. A frame that took much longer than that
+        # (the computer was asleep) isn't caught up on.
+        await simulate_physics(
+            min(frame_driver.frame_time, 2 / globals_list.idle_frame_rate)
         )
     else:
-        globals_list.display.fill((255, 255, 255))
+        await simulate_physics(frame_driver.step_dt)
+
+
+async def _particles_phase():
+    """Move the particles of every emitter."""
+    if window_state.paused:
+        return
+    for emitter in globals_list.emitters:
+        emitter.simulate(frame_driver.frame_time)
+
+
+def _bodies_moving():
+    """Check if any physics body is awake and moving.
+    :return: True if a body might move its sprite before the next frame."""
+    for body in physics_space.bodies:
+        if (
+            body.body_type == _pymunk.Body.DYNAMIC
+            and not body.is_sleeping
+            and (body.velocity.length > 0 or body.angular_velocity != 0)
+        ):
+            return True
+    return False
+
+
+async def _backdrop_phase():
+    """Decide if this frame has to be drawn, and draw the backdrop if so."""
+    # changes made by the callbacks of the sprites phase are drawn with this frame
+    # if it is drawn, and leave the scene dirty for the next frame otherwise.
+    # Sprite batches are changed through their arrays, so they are always drawn.
+    frame_driver.render = window_state.should_render and (
+        scene.needs_drawing()
+        or _bodies_moving()
+        or bool(globals_list.batches)
+        or bool(globals_list.emitters)
+    )
+    if frame_driver.render:
+        renderer.draw_backdrop()
+
+
+async def _sprites_phase():
+    """Update and draw all sprites."""
+    await _update_sprites(draw=frame_driver.render)
+
+
+async def _flip_phase():
+    """Show the drawn frame on the screen."""
+    if frame_driver.render:
+        renderer.present()
+        scene.drawn()
+
+
+FRAME_PHASES = (
+    ("events", _events_phase),
+    ("keyboard", _keyboard_phase),
+    ("mouse", _mouse_phase),
+    ("controller", _controller_phase),
+    ("repeat_forever", _repeat_forever_phase),
+    ("physics", _physics_phase),
+    ("particles", _particles_phase),
+    ("backdrop", _backdrop_phase),
+    ("sprites", _sprites_phase),
+    ("flip", _flip_phase),
+)
+
+
+async def run_frame():
+    """Run every phase of a single frame.
+    :return: False if the program should stop."""
+    frame_driver.frame_start = _perf_counter()
+    frame_driver.run_hooks("before_frame")
+
+    keyboard_state.clear()
+    mouse_state.clear()
+    controller_state.clear()
+
+    if not stats.enabled:
+        for _, phase in FRAME_PHASES:
+            if await phase() is False:
+                return False
+    else:
+        for name, phase in FRAME_PHASES:
+            phase_start = _perf_counter()
+            result = await phase()
+            stats.record(name, _perf_counter() - phase_start)
+            if result is False:
+                return False
+        stats.record("frame", _perf_counter() - frame_driver.frame_start)
+        stats.end_frame()
+
+    frame_driver.frame_count += 1
+    frame_driver.frame_drawn()
+    if not window_state.paused:
+        timer_wheel.advance(frame_driver.frame_time)
+    stats.set_count("timers_pending", timer_wheel.pending)
+    frame_driver.run_hooks("after_frame")
+    return True
 
-    await _update_sprites()
 
-    pygame.display.flip()
-    _loop.create_task(game_loop())
+@listen_to_failure()
+async def game_loop():
+    """The main game loop. A single task that keeps drawing frames until the program stops."""
+    frame_driver.running = True
+    _clock.tick()  # the first frame shouldn't include the time spent loading the program
+    while frame_driver.running:
+        # window_state.frame_rate drops to the idle frame rate while power saving
+        frame_driver.frame_time = _clock.tick(window_state.frame_rate) / 1000
+
+        if not await run_frame():
+            break
+
+        # let the callbacks started during this frame run before the next one
+        await _asyncio.sleep(0)
+    frame_driver.running = False
+
+
+async def step_frames(num_frames, dt=None):
+    """Run the game loop for a number of frames without waiting for the clock.
+    :param num_frames: The number of frames to run.
+    :param dt: The number of seconds each frame takes. Defaults to 1 / FRAME_RATE.
+    :return: The number of frames that were run."""
+    frame_driver.step_dt = dt
+    frame_driver.running = True
+    frames = 0
+    try:
+        while frames < num_frames and frame_driver.running:
+            frame_driver.frame_time = (
+                dt if dt is not None else 1 / globals_list.FRAME_RATE
+            )
+            if not await run_frame():
+                break
+            frames += 1
+            await _asyncio.sleep(0)
+    finally:
+        frame_driver.step_dt = None
+    return frames
@@ -0,0 +1,58 @@
+"""This module keeps track of the frames drawn by the game loop."""
+
+from ..loop import loop as _loop
+
+
+class FrameDriver:
+    """Class to manage the state of the long-lived frame driver."""
+
+    def __init__(self):
+        self.frame_count = 0
+        self.frame_time = 0.0
+        self.frame_start = 0.0
+        self.step_dt = None
+        self.render = True
+        self.started = False
+        self.running = False
+        self._hooks = {"before_frame": [], "after_frame": []}
+        self._next_frame = None
+
+    def add_hook(self, when, hook):
+        """Run a function at a fixed point of every frame.
+        :param when: Either "before_frame" or "after_frame".
+        :param hook: A regular (non-async) function without arguments."""
+        if when not in self._hooks:
+            raise ValueError(
+                f"Unknown frame hook '{when}', use 'before_frame' or 'after_frame'."
+            )
+        self._hooks[when].append(hook)
+
+    def remove_hook(self, when, hook):
+        """Stop running a function that was added with add_hook.
+        :param when: Either "before_frame" or "after_frame".
+        :param hook: The function to remove."""
+        if hook in self._hooks.get(when, []):
+            self._hooks[when].remove(hook)
+
+    def next_frame(self):
+        """Get a future that is resolved once the next frame has been drawn.
+        Every coroutine waiting for the same frame shares this future.
+        :return: An asyncio future with the frame count as result."""
+        if self._next_frame is None:
+            self._next_frame = _loop.create_future()
+        return self._next_frame
+
+    def frame_drawn(self):
+        """Wake up everything that was waiting for the frame that was just drawn."""
+        future, self._next_frame = self._next_frame, None
+        if future is not None and not future.done():
+            future.set_result(self.frame_count)
+
+    def run_hooks(self, when):
+        """Run all hooks registered for a point of the frame.
+        :param when: Either "before_frame" or "after_frame"."""
+        for hook in self._hooks[when]:
+            hook()
+
+
+frame_driver = FrameDriver()
@@ -3,8 +3,14 @@
 import pygame
 
 from ..callback import callback_manager, CallbackType
+from ..globals import globals_list
 from ..io.mouse import mouse
-from ..io.screen import screen
+from ..io.screen import screen, convert_pos
+from ..objects.sprite import point_touching_sprite
+from ..utils.spatial_grid import sprite_grid, EVERYTHING
+
+
+CLICK_MODES = ("all", "topmost")
 
 
 class MouseState:  # pylint: disable=too-few-public-methods
@@ -12,11 +18,19 @@ class MouseState:  # pylint: disable=too-few-public-methods
 
     click_happened = False
     click_release_happened = False
+    mouse_moved = False
+    # "all" clicks every sprite under the mouse pointer, "topmost" only the one on top
+    click_mode = "all"
+    # the sprites clicked in the last frame, whose is_clicked is reset in the next one
+    clicked_sprites = []
+    # the sprites with hover events that the mouse pointer is over
+    hovered_sprites = set()
 
     def clear(self):
         """Clear the mouse state for the next frame."""
         self.click_happened = False
         self.click_release_happened = False
+        self.mouse_moved = False
 
 
 mouse_state = MouseState()
@@ -31,11 +45,62 @@ def handle_mouse_events(event):
         mouse_state.click_release_happened = True
         mouse._is_clicked = False
     if event.type == pygame.MOUSEMOTION:  # pylint: disable=no-member
+        mouse_state.mouse_moved = True
         mouse.x, mouse.y = (event.pos[0] - screen.width / 2.0), (
             screen.height / 2.0 - event.pos[1]
         )
 
 
+def sprites_under_mouse():
+    """Find the shown sprites under the mouse pointer, looking only at the sprites
+    near it.
+    :return: A list of the sprites, in the order they are drawn."""
+    point = convert_pos(mouse.x, mouse.y)
+    nearby = sprite_grid.query(pygame.Rect(point, (1, 1)))
+    if nearby is EVERYTHING:
+        nearby = globals_list.sprites_group.sprites()
+    return sorted(
+        (
+            sprite
+            for sprite in nearby
+            if not sprite.is_hidden and point_touching_sprite(point, sprite)
+        ),
+        key=lambda sprite: sprite._draw_order,
+    )
+
+
+def _update_hovered_sprites():
+    """Run the mouse over and mouse leave events of the sprites the mouse pointer
+    entered or left since it last moved. Only sprites with hover events are kept."""
+    hover_types = [
+        CallbackType.WHEN_MOUSE_OVER_SPRITE,
+        CallbackType.WHEN_MOUSE_LEAVE_SPRITE,
+    ]
+    hovered = [
+        sprite
+        for sprite in sprites_under_mouse()
+        if callback_manager.get_callback(hover_types, id(sprite))
+    ]
+    left = sorted(
+        (sprite for sprite in mouse_state.hovered_sprites if sprite not in hovered),
+        key=lambda sprite: sprite._draw_order,
+    )
+    entered = [
+        sprite for sprite in hovered if sprite not in mouse_state.hovered_sprites
+    ]
+    mouse_state.hovered_sprites = set(hovered)
+    for sprite in left:
+        # removed sprites are forgotten without a mouse leave event
+        if sprite.alive():
+            callback_manager.run_callbacks(
+                CallbackType.WHEN_MOUSE_LEAVE_SPRITE, callback_discriminator=id(sprite)
+            )
+    for sprite in entered:
+        callback_manager.run_callbacks(
+            CallbackType.WHEN_MOUSE_OVER_SPRITE, callback_discriminator=id(sprite)
+        )
+
+
 async def handle_mouse_loop():
     """Handle mouse events in the game loop."""
     ####################################
@@ -49,3 +114,9 @@ async def handle_mouse_loop():
     ########################################
     if mouse_state.click_release_happened:
         callback_manager.run_callbacks(CallbackType.WHEN_CLICK_RELEASED)
+
+    ##############################################################
+    # @sprite.when_mouse_over and @sprite.when_mouse_leave callbacks
+    ##############################################################
+    if mouse_state.mouse_moved:
+        _update_hovered_sprites()
@@ -1,16 +1,124 @@
 """This module contains the function that simulates the physics of the game"""
 
-from .sprites_loop import update_sprites
+import math as _math
+from time import perf_counter as _perf_counter
+
+import pymunk as _pymunk
+
+from .frame_driver import frame_driver
 from ..globals import globals_list
 from ..physics import physics_space
+from ..utils.stats import stats
+
+
+class FixedTimestepState:  # pylint: disable=too-few-public-methods
+    """Class to keep track of the time the physics still has to catch up on."""
+
+    def __init__(self):
+        self.accumulator = 0.0
+
+    def clear(self):
+        """Forget the time that hasn't been simulated yet."""
+        self.accumulator = 0.0
+
+
+fixed_timestep_state = FixedTimestepState()
+
+
+class AdaptiveStepsState:  # pylint: disable=too-few-public-methods
+    """Class to keep track of how long a single physics step takes."""
+
+    def __init__(self):
+        self.step_cost = 0.0
+
+
+adaptive_steps_state = AdaptiveStepsState()
+
 
+def choose_sim_steps(dt):
+    """
+    Pick the number of simulation steps for this frame, so the fastest body moves at most
+    half the size of the smallest moving shape per step, within the step ceiling and the
+    time left in the frame.
+    :param dt: The number of seconds the simulation advances this frame.
+    :return: The number of simulation steps.
+    """
+    max_speed = 0.0
+    smallest_size = _math.inf
+    for shape in physics_space.shapes:
+        body = shape.body
+        if body.body_type == _pymunk.Body.STATIC or body.is_sleeping:
+            continue
+        max_speed = max(max_speed, body.velocity.length)
+        bb = shape.bb
+        smallest_size = min(smallest_size, bb.right - bb.left, bb.top - bb.bottom)
+
+    if max_speed == 0 or smallest_size == _math.inf:
+        return 1
+
+    steps = _math.ceil(max_speed * dt / max(smallest_size / 2, 1))
+    steps = min(max(steps, 1), globals_list.max_sim_steps)
 
-async def simulate_physics():
+    # don't spend more time on physics than there is left in this frame
+    if adaptive_steps_state.step_cost > 0:
+        time_left = (1 / globals_list.FRAME_RATE) - (
+            _perf_counter() - frame_driver.frame_start
+        )
+        steps = min(steps, max(int(time_left / adaptive_steps_state.step_cost), 1))
+    return steps
+
+
+async def simulate_physics(dt=None):
     """
     Simulate the physics of the game
+    :param dt: The number of seconds to advance the simulation. Defaults to one frame.
     """
+    if globals_list.adaptive_sim_steps:
+        frame_dt = dt if dt is not None else 1 / globals_list.FRAME_RATE
+        num_steps = choose_sim_steps(frame_dt)
+        step_dt = frame_dt / num_steps
+    else:
+        num_steps = globals_list.num_sim_steps
+        if dt is None:
+            step_dt = 1 / (globals_list.FRAME_RATE * num_steps)
+        else:
+            step_dt = dt / num_steps
+    stats.count("physics_steps", num_steps)
+
     # more steps means more accurate simulation but more processing time
-    for _ in range(globals_list.num_sim_steps):
-        physics_space.step(1 / (globals_list.FRAME_RATE * globals_list.num_sim_steps))
-        if not _ == globals_list.num_sim_steps - 1:
-            await update_sprites(False)
+    physics_start = _perf_counter()
+    # sprites are moved to their bodies once per frame, after the last step
+    for _ in range(num_steps):
+        physics_space.step(step_dt)
+
+    if globals_list.adaptive_sim_steps:
+        step_cost = (_perf_counter() - physics_start) / num_steps
+        if adaptive_steps_state.step_cost:
+            # a moving average, so a single slow frame doesn't starve the next ones
+            step_cost = 0.9 * adaptive_steps_state.step_cost + 0.1 * step_cost
+        adaptive_steps_state.step_cost = step_cost
+
+
+async def simulate_fixed_physics(frame_time):
+    """
+    Simulate the physics of the game in constant ticks of 1 / physics_rate seconds.
+    Time that isn't simulated yet is carried over to the next frame.
+    :param frame_time: The number of seconds since the previous frame.
+    :return: The number of physics ticks that were simulated.
+    """
+    tick = 1 / globals_list.physics_rate
+    fixed_timestep_state.accumulator += frame_time
+
+    ticks = 0
+    while (
+        fixed_timestep_state.accumulator >= tick
+        and ticks < globals_list.max_physics_steps_per_frame
+    ):
+        await simulate_physics(tick)
+        fixed_timestep_state.accumulator -= tick
+        ticks += 1
+
+    # we fell too far behind: drop the backlog instead of spiralling into slow motion
+    if fixed_timestep_state.accumulator >= tick:
+        fixed_timestep_state.accumulator %= tick
+    return ticks
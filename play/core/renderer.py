@@ -0,0 +1,136 @@
+"""This module draws the backdrop and the sprites on the screen."""
+
+import pygame
+
+from ..globals import globals_list
+from ..io.viewport import viewport
+from ..utils.stats import stats
+
+RENDERERS = ("full", "dirty")
+
+
+class Renderer:
+    """
+    Draws the frames of the game loop. The "full" renderer fills the whole
+    screen, draws every sprite and flips the screen every frame. The "dirty"
+    renderer keeps the backdrop in a surface and only draws the rectangles that
+    sprites moved away from or to, which is a lot less work when only a few
+    sprites move in front of a large backdrop.
+    """
+
+    def __init__(self):
+        self.mode = "full"
+        self._background = None
+        self._background_key = None
+        self._rects = []
+        # whether the dirty renderer has sprites that were culled in the last frame
+        self._culled = False
+
+    def set_mode(self, mode):
+        """Switch to another renderer, keeping all sprites.
+        :param mode: Either "full" or "dirty"."""
+        if mode not in RENDERERS:
+            raise ValueError(
+                f"Unknown renderer '{mode}', use one of: {', '.join(RENDERERS)}."
+            )
+        if mode == self.mode:
+            return
+        sprites = globals_list.sprites_group.sprites()
+        globals_list.sprites_group.empty()
+        if mode == "dirty":
+            globals_list.sprites_group = pygame.sprite.LayeredDirty(*sprites)
+        else:
+            globals_list.sprites_group = pygame.sprite.Group(*sprites)
+        self.mode = mode
+        self._background = None
+        self._background_key = None
+
+    def repaint(self):
+        """Draw the whole screen again in the next drawn frame."""
+        self._background_key = None
+
+    def _update_background(self):
+        """Draw the backdrop into the cached background surface if it changed."""
+        display = globals_list.display
+        if globals_list.backdrop_type == "image":
+            key = ("image", id(globals_list.backdrop), display.get_size())
+        else:
+            key = ("color", globals_list.backdrop, display.get_size())
+        if key == self._background_key:
+            return
+        self._background_key = key
+        self._background = pygame.Surface(display.get_size())
+        if globals_list.backdrop_type == "color":
+            self._background.fill(globals_list.backdrop)
+        else:
+            self._background.fill((255, 255, 255))
+            self._background.blit(globals_list.backdrop, (0, 0))
+        globals_list.sprites_group.repaint_rect(display.get_rect())
+
+    def draw_backdrop(self):
+        """Draw the backdrop, or get it ready to draw behind the sprites."""
+        if self.mode == "dirty":
+            self._update_background()
+            if globals_list.batches or globals_list.emitters:
+                # sprite batches and particles don't keep track of where they were drawn
+                globals_list.sprites_group.repaint_rect(globals_list.display.get_rect())
+        elif globals_list.backdrop_type == "color":
+            globals_list.display.fill(globals_list.backdrop)
+        elif globals_list.backdrop_type == "image":
+            globals_list.display.blit(
+                globals_list.backdrop,
+                (0, 0),
+            )
+        else:
+            globals_list.display.fill((255, 255, 255))
+
+    def _cull(self):
+        """Find the sprites on the screen. The dirty renderer skips the others
+        through their visible attribute.
+        :return: The sprites whose rect touches the screen."""
+        sprites = globals_list.sprites_group.sprites()
+        visible = [sprite for sprite in sprites if viewport.is_visible(sprite.rect)]
+        if self.mode == "dirty" and (viewport.culling or self._culled):
+            shown = set(visible)
+            for sprite in sprites:
+                on_screen = int(sprite in shown)
+                if sprite.visible != on_screen:
+                    sprite.visible = on_screen
+            self._culled = len(visible) < len(sprites)
+        stats.count("sprites_culled", len(sprites) - len(visible))
+        return visible
+
+    def draw_sprites(self):
+        """Draw all sprites on the screen."""
+        group = globals_list.sprites_group
+        if not viewport.culling and not self._culled:
+            stats.count("sprites_drawn", len(group))
+            visible = None
+        else:
+            visible = self._cull()
+            stats.count("sprites_drawn", len(visible))
+
+        if self.mode == "dirty":
+            self._rects = group.draw(globals_list.display, self._background)
+        elif visible is None:
+            group.draw(globals_list.display)
+        else:
+            globals_list.display.blits(
+                [(sprite.image, sprite.rect) for sprite in visible], doreturn=False
+            )
+        for batch in globals_list.batches:
+            stats.count("batch_sprites_drawn", batch.draw(globals_list.display))
+        for emitter in globals_list.emitters:
+            emitter.draw(globals_list.display)
+
+    def present(self):
+        """Show the drawn frame on the screen."""
+        if self.mode == "dirty":
+            if self._rects:
+                pygame.display.update(self._rects)
+            self._rects = []
+        else:
+            pygame.display.flip()
+
+
+renderer = Renderer()
@@ -2,72 +2,97 @@
 
 import math as _math
 
-from .mouse_loop import mouse_state
+from .mouse_loop import mouse_state, sprites_under_mouse
+from .renderer import renderer
 from ..callback import callback_manager, CallbackType
 from ..callback.callback_helpers import run_any_async_callback
+from ..callback.collision_callbacks import collision_registry
 from ..globals import globals_list
 from ..io.mouse import mouse
-from ..io.screen import convert_pos
 from ..objects.line import Line
-from ..objects.sprite import point_touching_sprite
 
 
-async def update_sprites(do_events: bool = True):  # pylint: disable=too-many-branches
-    """Update all sprites in the game loop.
-    :param do_events: If True, run events for sprites. If False, only update positions.
-    """
-    globals_list.sprites_group.update()
+def _sync_physics(sprite):
+    """Move a sprite to where the physics simulation moved its body.
+    :param sprite: A sprite whose body can move."""
+    body = sprite.physics._pymunk_body
+    angle = _math.degrees(body.angle)
+    if isinstance(sprite, Line):
+        half = sprite.length / 2
+        sprite._set("_x", body.position.x - half * _math.cos(angle))
+        sprite._set("_y", body.position.y - half * _math.sin(angle))
+        sprite._set("_x1", body.position.x + half * _math.cos(angle))
+        sprite._set("_y1", body.position.y + half * _math.sin(angle))
+    else:
+        if (
+            str(body.position.x) != "nan"
+        ):  # this condition can happen when changing sprite.physics.can_move
+            sprite._set("_x", body.position.x, sprite._move_flag)
+        if str(body.position.y) != "nan":
+            sprite._set("_y", body.position.y, sprite._move_flag)
+
+    sprite.angle = angle
+    sprite.physics._x_speed, sprite.physics._y_speed = body.velocity
+
 
-    for sprite in globals_list.sprites_group.sprites():
-        ######################################################
-        # update sprites with results of physics simulation
-        ######################################################
+async def update_sprites(draw: bool = True):
+    """Update all sprites in the game loop, once per frame. Every sprite is moved
+    to its physics body, updated, and then runs its events.
+    :param draw: If True, draw the sprites on the screen after updating them.
+    """
+    sprites = globals_list.sprites_group.sprites()
+    for sprite in sprites:
         if sprite.physics and sprite.physics.can_move:
-            body = sprite.physics._pymunk_body
-            angle = _math.degrees(body.angle)
-            if isinstance(sprite, Line):
-                sprite._x = body.position.x - (sprite.length / 2) * _math.cos(angle)
-                sprite._y = body.position.y - (sprite.length / 2) * _math.sin(angle)
-                sprite._x1 = body.position.x + (sprite.length / 2) * _math.cos(angle)
-                sprite._y1 = body.position.y + (sprite.length / 2) * _math.sin(angle)
-            else:
-                if (
-                    str(body.position.x) != "nan"
-                ):  # this condition can happen when changing sprite.physics.can_move
-                    sprite._x = body.position.x
-                if str(body.position.y) != "nan":
-                    sprite._y = body.position.y
+            _sync_physics(sprite)
 
-            sprite.angle = angle
-            sprite.physics._x_speed, sprite.physics._y_speed = body.velocity
+    globals_list.sprites_group.update()
 
-        sprite._is_clicked = False
+    for sprite in sprites:
         if sprite.is_hidden:
             continue
 
-        if not do_events and not sprite.physics:
-            continue
-
         #################################
         # All @sprite.when_touching events
         #################################
-        await run_any_async_callback(sprite._touching_callback, [], [])
+        # collisions that began and ended in the same frame still run their callback
+        touching = sprite._touching_callback + [
+            callback
+            for callback in collision_registry.began(sprite)
+            if callback not in sprite._touching_callback
+        ]
+        await run_any_async_callback(touching, [], [])
 
         await run_any_async_callback(sprite._stopped_callback, [], [])
         sprite._stopped_callback = [None, None]
 
-        #################################
-        # @sprite.when_clicked events
-        #################################
-        if (
-            mouse.is_clicked
-            and point_touching_sprite(convert_pos(mouse.x, mouse.y), sprite)
-            and mouse_state.click_happened
-        ):
+        # when_touching and when_stopped_touching events of groups
+        for subscription in sprite._group_subscriptions:
+            await subscription.run(sprite)
+    collision_registry.end_frame()
+
+    #################################
+    # @sprite.when_clicked events
+    #################################
+    for sprite in mouse_state.clicked_sprites:
+        sprite._is_clicked = False
+    mouse_state.clicked_sprites = []
+    if mouse.is_clicked and mouse_state.click_happened:
+        mouse_state.clicked_sprites = sprites_under_mouse()
+        if mouse_state.click_mode == "topmost":
+            mouse_state.clicked_sprites = mouse_state.clicked_sprites[-1:]
+        for sprite in mouse_state.clicked_sprites:
             sprite._is_clicked = True
             callback_manager.run_callbacks(
                 CallbackType.WHEN_CLICKED_SPRITE, callback_discriminator=id(sprite)
             )
 
-    globals_list.sprites_group.update()
-    globals_list.sprites_group.draw(globals_list.display)
+    # the events above may have changed sprites, draw those changes in this frame.
+    # Sprites off the screen that didn't move would only put off drawing again.
+    for sprite in sprites:
+        if sprite._should_move or (
+            (sprite._should_recompute or sprite._should_rotate)
+            and not sprite._is_deferred
+        ):
+            sprite.update()
+    if draw:
+        renderer.draw_sprites()
@@ -0,0 +1,122 @@
+"""A hierarchical timer wheel that runs timers on the frame clock of the game loop."""
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+
+
+class TimerHandle:  # pylint: disable=too-few-public-methods
+    """A timer that was scheduled on the timer wheel."""
+
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+
+class TimerWheel:
+    """
+    Timers are kept in levels of 64 slots. The first level has a slot per tick,
+    every next level has a slot per 64 slots of the level below it. A timer goes
+    in the lowest level that reaches its deadline and moves down a level each time
+    the level below it wraps around, so scheduling, cancelling and firing are all
+    O(1) amortized, no matter how many timers are waiting.
+    """
+
+    def __init__(self, resolution=0.001, levels=4):
+        self.resolution = resolution
+        self.now = 0.0
+        self._tick = 0
+        self._pending = 0
+        self._wheels = [[[] for _ in range(SLOTS)] for _ in range(levels)]
+        self._overflow = []
+
+    @property
+    def pending(self):
+        """Get the number of timers that haven't fired or been cancelled yet.
+        :return: The number of pending timers."""
+        return self._pending
+
+    def schedule(self, delay, callback, *args):
+        """Call a function after a number of seconds of frame time.
+        :param delay: The number of seconds to wait.
+        :param callback: The function to call.
+        :param args: The arguments to call the function with.
+        :return: A handle that can be passed to cancel()."""
+        ticks = max(round(delay / self.resolution), 1)
+        handle = TimerHandle(self._tick + ticks, callback, args)
+        self._place(handle)
+        self._pending += 1
+        return handle
+
+    def cancel(self, handle):
+        """Stop a timer from firing.
+        :param handle: The handle returned by schedule()."""
+        if not handle.cancelled:
+            handle.cancelled = True
+            self._pending -= 1
+
+    def advance(self, seconds):
+        """Move the frame clock forward and fire every timer that is due.
+        :param seconds: The number of seconds that passed."""
+        self.now += seconds
+        # a small margin, so 60 frames of 1/60 s always add up to a whole second
+        target = int(self.now / self.resolution + 1e-6)
+        if self._pending == 0:
+            # nothing can be due, so there is nothing to move between levels either
+            self._tick = max(self._tick, target)
+            return
+        while self._tick < target:
+            self._tick += 1
+            self._cascade()
+            slot = self._wheels[0][self._tick & SLOT_MASK]
+            if slot:
+                self._wheels[0][self._tick & SLOT_MASK] = []
+                self._fire(slot)
+
+    def _place(self, handle):
+        delta = handle.deadline - self._tick
+        for level, wheel in enumerate(self._wheels):
+            if delta < 1 << (SLOT_BITS * (level + 1)):
+                wheel[(handle.deadline >> (SLOT_BITS * level)) & SLOT_MASK].append(
+                    handle
+                )
+                return
+        self._overflow.append(handle)
+
+    def _cascade(self):
+        # find the highest level whose lower levels all just wrapped around
+        top = 0
+        while (
+            top + 1 < len(self._wheels)
+            and self._tick & ((1 << (SLOT_BITS * (top + 1))) - 1) == 0
+        ):
+            top += 1
+        if top + 1 == len(self._wheels) and top > 0:
+            overflow, self._overflow = self._overflow, []
+            for handle in overflow:
+                self._place(handle)
+
+        # move the timers of those levels down, the highest level first
+        for level in range(top, 0, -1):
+            index = (self._tick >> (SLOT_BITS * level)) & SLOT_MASK
+            slot = self._wheels[level][index]
+            if slot:
+                self._wheels[level][index] = []
+                for handle in slot:
+                    if not handle.cancelled:
+                        self._place(handle)
+
+    def _fire(self, slot):
+        for handle in slot:
+            if handle.cancelled:
+                continue
+            handle.cancelled = True
+            self._pending -= 1
+            handle.callback(*handle.args)
+
+
+timer_wheel = TimerWheel()
@@ -0,0 +1,68 @@
+"""This module keeps track of the focus and visibility of the window."""
+
+import pygame
+
+from .renderer import renderer
+from ..globals import globals_list
+from ..utils.scene import scene
+
+
+class WindowState:
+    """Class to manage the state of the window."""
+
+    focused = True
+    visible = True
+
+    @property
+    def idle(self):
+        """Check if the power saving policy applies to the current frame.
+        :return: True if power saving is on and the window is unfocused or hidden."""
+        return globals_list.power_saving and not (self.focused and self.visible)
+
+    @property
+    def should_render(self):
+        """Check if the current frame should be drawn.
+        :return: False if power saving is on and nobody can see the window."""
+        return not (globals_list.power_saving and not self.visible)
+
+    @property
+    def paused(self):
+        """Check if physics and timers should stand still this frame.
+        :return: True if the window is idle and the policy pauses idle windows."""
+        return self.idle and globals_list.pause_when_idle
+
+    @property
+    def frame_rate(self):
+        """Get the number of frames per second the game loop should run at.
+        :return: The idle frame rate while idle, otherwise the regular frame rate."""
+        if self.idle:
+            return globals_list.idle_frame_rate
+        return globals_list.FRAME_RATE
+
+
+window_state = WindowState()
+
+
+def handle_window_events(event):
+    """Handle window events and update the window state."""
+    if event.type == pygame.WINDOWFOCUSLOST:  # pylint: disable=no-member
+        window_state.focused = False
+    elif event.type == pygame.WINDOWFOCUSGAINED:  # pylint: disable=no-member
+        window_state.focused = True
+    elif event.type in (
+        pygame.WINDOWMINIMIZED,  # pylint: disable=no-member
+        pygame.WINDOWHIDDEN,  # pylint: disable=no-member
+    ):
+        window_state.visible = False
+    elif event.type in (
+        pygame.WINDOWRESTORED,  # pylint: disable=no-member
+        pygame.WINDOWSHOWN,  # pylint: disable=no-member
+        pygame.WINDOWMAXIMIZED,  # pylint: disable=no-member
+    ):
+        window_state.visible = True
+        scene.mark_dirty()
+        renderer.repaint()
+    elif event.type == pygame.WINDOWEXPOSED:  # pylint: disable=no-member
+        # another window was on top of this one, the screen has to be drawn again
+        scene.mark_dirty()
+        renderer.repaint()
@@ -1,11 +1,15 @@
 """Global variables for the game"""
 
+import os
+
 import pygame
 
 
-class Globals:  # pylint: disable=too-few-public-methods
+class Globals:  # pylint: disable=too-few-public-methods, invalid-name
     all_sprites = []
     sprites_group = pygame.sprite.Group()
+    batches = []
+    emitters = []
 
     walls = []
 
@@ -18,8 +22,19 @@ class Globals:  # pylint: disable=too-few-public-methods
 
     gravity = None
     num_sim_steps = 10
+    adaptive_sim_steps = False
+    max_sim_steps = 10
+
+    fixed_timestep = False
+    physics_rate = 60
+    max_physics_steps_per_frame = 5
+
+    power_saving = False
+    idle_frame_rate = 5
+    pause_when_idle = False
 
     display = None  # This will be set in the screen module
+    headless = os.environ.get("PLAY_HEADLESS", "") not in ("", "0")
     controllers = []
 
 
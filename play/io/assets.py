@@ -0,0 +1,82 @@
+"""This module loads image files once and shares them between sprites."""
+
+import os
+
+import pygame
+
+from ..utils.stats import stats
+
+
+def _surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+class ImageAssets:
+    """
+    Every image file is decoded once and converted to the pixel format of the
+    screen, so drawing it doesn't have to convert its pixels every frame. Sprites
+    made from the same file share the loaded surface, which must never be drawn on.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._images = {}
+
+    def load(self, path):
+        """Load an image file, or get it if it was loaded before.
+        :param path: The path of the image file.
+        :return: The loaded surface, shared with every other sprite of the same file."""
+        key = os.path.abspath(path)
+        surface = self._images.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Image file '{path}' not found.")
+        surface = self._convert(pygame.image.load(path))
+        stats.count("surfaces_allocated")
+        self.misses += 1
+        self._images[key] = surface
+        self.bytes += _surface_bytes(surface)
+        return surface
+
+    @staticmethod
+    def _convert(surface):
+        """Convert a surface to the pixel format of the screen, keeping its transparency.
+        :param surface: The surface that was loaded.
+        :return: The converted surface, or the loaded one if there is no screen yet."""
+        if pygame.display.get_surface() is None:
+            return surface
+        if surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey():
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def preload(self, paths):
+        """Load image files before they are needed, so making sprites of them later
+        doesn't have to wait for the files.
+        :param paths: A list of paths of image files."""
+        for path in paths:
+            self.load(path)
+
+    def info(self):
+        """Get the statistics of the loaded images.
+        :return: A dictionary with the hits, misses, bytes and number of images."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes": self.bytes,
+            "images": len(self._images),
+        }
+
+    def clear(self):
+        """Forget every loaded image, so files are read again the next time."""
+        self._images.clear()
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+
+
+image_assets = ImageAssets()
@@ -1,5 +1,6 @@
 """This module provides a wrapper around the Pygame display module to create a screen object"""
 
+import os
 from sys import platform
 
 import pygame
@@ -20,6 +21,11 @@ from ..utils.async_helpers import make_async
 
 PYGAME_DISPLAY = None
 
+if globals_list.headless:
+    # SDL reads these when the display is opened, so they have to be set before Screen()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 
 class Screen:
     def update_display(self, extra_flags=0):
@@ -155,7 +161,7 @@ class Screen:
 
     def enable_fullscreen(self):
         """Enable fullscreen mode."""
-        if self._fullscreen:
+        if self._fullscreen or globals_list.headless:
             return
         self._fullscreen = True
 
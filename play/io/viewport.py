@@ -0,0 +1,38 @@
+"""This module keeps track of the part of the game that is on the screen."""
+
+import pygame
+
+from .screen import screen
+
+
+class Viewport:
+    """
+    The visible part of the game, for culling sprites. With culling on, sprites
+    whose rect lies entirely outside the screen aren't drawn, and changes to how
+    they look are only drawn once they come back on the screen. Sprites within
+    margin pixels of the edge still count as visible.
+    """
+
+    def __init__(self):
+        self.culling = False
+        self.margin = 0
+
+    @property
+    def rect(self):
+        """Get the visible area in the coordinates of the screen surface.
+        :return: A pygame.Rect, grown by the margin on every side."""
+        return pygame.Rect(
+            -self.margin,
+            -self.margin,
+            screen.width + 2 * self.margin,
+            screen.height + 2 * self.margin,
+        )
+
+    def is_visible(self, rect):
+        """Check if a rect of a sprite is on the screen.
+        :param rect: The rect of the sprite.
+        :return: True if culling is off or the rect touches the visible area."""
+        return not self.culling or self.rect.colliderect(rect)
+
+
+viewport = Viewport()
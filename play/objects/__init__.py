@@ -12,3 +12,6 @@ from .sprite import Sprite
 from .text import Text
 from .image import Image
 from .sound import Sound
+from .sprite_batch import SpriteBatch
+from .emitter import Emitter
+from .group import Group
@@ -5,22 +5,34 @@ import pygame
 from .sprite import Sprite
 from ..io.screen import convert_pos
 from ..utils import color_name_to_rgb as _color_name_to_rgb
+from ..utils.stats import stats
+from ..utils.surface_cache import surface_cache
 
 
 class Box(Sprite):
+    __slots__ = (
+        "_color",
+        "_width",
+        "_height",
+        "_border_color",
+        "_border_width",
+        "_border_radius",
+        "_base_key",
+    )
+
     def __init__(
         self,
-        color = "black",
-        x = 0,
-        y = 0,
-        width = 100,
-        height = 200,
-        border_color = "light blue",
-        border_width = 0,
-        border_radius = 0,
-        transparency = 100,
-        size = 100,
-        angle = 0,
+        color="black",
+        x=0,
+        y=0,
+        width=100,
+        height=200,
+        border_color="light blue",
+        border_width=0,
+        border_radius=0,
+        transparency=100,
+        size=100,
+        angle=0,
     ):
         super().__init__(self)
         self._color = color
@@ -34,50 +46,79 @@ class Box(Sprite):
         self._transparency = transparency
         self._size = size
         self._angle = angle
+        self._base_key = None
         self.rect = pygame.Rect(0, 0, 0, 0)
         self.update()
 
-    def update(self):
-        """Update the box's position, size, angle, transparency, and border."""
-        if self._should_recompute:
-            draw_image = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
-
-            if self._border_width > 0:
-                pygame.draw.rect(
-                    draw_image,
-                    _color_name_to_rgb(self._border_color),
-                    (0, 0, self._width, self._height),
-                    self._border_width,
-                    border_radius=self._border_radius,
-                )
-
+    def _render_image(self):
+        """Get the drawing of the box from the surface cache."""
+        key = (
+            "box",
+            self._width,
+            self._height,
+            _color_name_to_rgb(self._color),
+            _color_name_to_rgb(self._border_color),
+            self._border_width,
+            self._border_radius,
+            int(self._transparency * 2.55),
+        )
+        self._base_key = key
+        self._base_image = surface_cache.get(key, self._draw_image)
+
+    def _draw_image(self):
+        """Draw the box with its border and transparency.
+        :return: The drawn surface."""
+        draw_image = pygame.Surface((self._width, self._height), pygame.SRCALPHA)
+        if self._border_width > 0:
             pygame.draw.rect(
                 draw_image,
-                _color_name_to_rgb(self._color),
-                (
-                    self._border_width,
-                    self._border_width,
-                    self._width - 2 * self._border_width,
-                    self._height - 2 * self._border_width,
-                ),
-                border_radius=max(self._border_radius - self._border_width, 0),
+                _color_name_to_rgb(self._border_color),
+                (0, 0, self._width, self._height),
+                self._border_width,
+                border_radius=self._border_radius,
             )
 
-            draw_image.set_alpha(int(self._transparency * 2.55))
-            draw_image = pygame.transform.rotate(draw_image, self._angle)
-
-            self.rect = draw_image.get_rect()
-            pos = convert_pos(self.x, self.y)
-            self.rect.x = pos[0] - self._width // 2
-            self.rect.y = pos[1] - self._height // 2
+        pygame.draw.rect(
+            draw_image,
+            _color_name_to_rgb(self._color),
+            (
+                self._border_width,
+                self._border_width,
+                self._width - 2 * self._border_width,
+                self._height - 2 * self._border_width,
+            ),
+            border_radius=max(self._border_radius - self._border_width, 0),
+        )
 
-            if self.physics:
-                angle_deg = -_math.degrees(self.physics._pymunk_body.angle)
-                self.image = pygame.transform.rotate(draw_image, angle_deg)
-                self.rect = self.image.get_rect(center=self.rect.center)
-            else:
-                self.image = draw_image
-        super().update()
+        draw_image.set_alpha(int(self._transparency * 2.55))
+        stats.count("surfaces_allocated")
+        return draw_image
+
+    def _rotate_image(self):
+        """Turn the box to its angle, and to the angle of its physics body."""
+        if self._angle % 360 == 0:
+            # a box that isn't turned doesn't need a turned copy in the cache
+            draw_image = self._base_image
+        else:
+            draw_image = surface_cache.rotate(
+                self._base_key, self._base_image, self._angle
+            )
+        self._rotated_rect = draw_image.get_rect()
+        if self.physics:
+            angle_deg = -_math.degrees(self.physics._pymunk_body.angle)
+            draw_image = pygame.transform.rotate(draw_image, angle_deg)
+            stats.count("surfaces_allocated")
+        self._rotated_image = draw_image
+        self._image = draw_image
+
+    def _position_rect(self):
+        """Move the box to its position."""
+        self.rect = self._rotated_rect.copy()
+        pos = convert_pos(self.x, self.y)
+        self.rect.x = pos[0] - self._width // 2
+        self.rect.y = pos[1] - self._height // 2
+        if self.physics:
+            self.rect = self._rotated_image.get_rect(center=self.rect.center)
 
     ##### width #####
     @property
@@ -90,7 +131,7 @@ class Box(Sprite):
     def width(self, _width):
         """Set the width of the box.
         :param _width: The new width of the box."""
-        self._width = _width
+        self._set("_width", _width)
 
     ##### height #####
     @property
@@ -103,7 +144,7 @@ class Box(Sprite):
     def height(self, _height):
         """Set the height of the box.
         :param _height: The new height of the box."""
-        self._height = _height
+        self._set("_height", _height)
 
     ##### color #####
     @property
@@ -116,7 +157,7 @@ class Box(Sprite):
     def color(self, _color):
         """Set the color of the box.
         :param _color: The new color of the box."""
-        self._color = _color
+        self._set("_color", _color)
 
     ##### border_color #####
     @property
@@ -129,7 +170,7 @@ class Box(Sprite):
     def border_color(self, _border_color):
         """Set the color of the box's border.
         :param _border_color: The new color of the box's border."""
-        self._border_color = _border_color
+        self._set("_border_color", _border_color)
 
     ##### border_width #####
     @property
@@ -142,7 +183,7 @@ class Box(Sprite):
     def border_width(self, _border_width):
         """Set the width of the box's border.
         :param _border_width: The new width of the box's border."""
-        self._border_width = _border_width
+        self._set("_border_width", _border_width)
 
     ##### border_radius #####
     @property
@@ -155,16 +196,16 @@ class Box(Sprite):
     def border_radius(self, _border_radius):
         """Set the radius of the box's border.
         :param _border_radius: The new radius of the box's border."""
-        self._border_radius = _border_radius
+        self._set("_border_radius", _border_radius)
 
     def clone(self):
         """Create a copy of the box.
         :return: A copy of the box."""
         return self.__class__(
-            color = self.color,
-            width = self.width,
-            height = self.height,
-            border_color = self.border_color,
-            border_width = self.border_width,
+            color=self.color,
+            width=self.width,
+            height=self.height,
+            border_color=self.border_color,
+            border_width=self.border_width,
             **self._common_properties()
         )
@@ -5,9 +5,20 @@ import pygame
 from .sprite import Sprite
 from ..io.screen import convert_pos
 from ..utils import color_name_to_rgb as _color_name_to_rgb
+from ..utils.stats import stats
+from ..utils.surface_cache import surface_cache
 
 
 class Circle(Sprite):
+    __slots__ = (
+        "_color",
+        "_radius",
+        "_border_color",
+        "_border_width",
+        "_when_clicked_callbacks",
+        "_base_key",
+    )
+
     def __init__(
         self,
         color="black",
@@ -37,6 +48,7 @@ class Circle(Sprite):
 
         self._when_clicked_callbacks = []
 
+        self._base_key = None
         self.rect = pygame.Rect(0, 0, 0, 0)
         self.update()
 
@@ -51,43 +63,63 @@ class Circle(Sprite):
             **self._common_properties()
         )
 
-    def update(self):
-        """Update the circle's position, size, angle, transparency, and border."""
-        if self._should_recompute:
-            draw_image = pygame.Surface(
-                (self._radius * 2, self._radius * 2), pygame.SRCALPHA
-            )
-
-            if self._border_width > 0:
-                pygame.draw.circle(
-                    draw_image,
-                    _color_name_to_rgb(self._border_color),
-                    (self._radius, self._radius),
-                    self._radius,
-                )
-
+    def _render_image(self):
+        """Get the drawing of the circle from the surface cache."""
+        key = (
+            "circle",
+            self._radius,
+            _color_name_to_rgb(self._color),
+            _color_name_to_rgb(self._border_color),
+            self._border_width,
+            self._transparency,
+        )
+        self._base_key = key
+        self._base_image = surface_cache.get(key, self._draw_image)
+
+    def _draw_image(self):
+        """Draw the circle with its border and transparency.
+        :return: The drawn surface."""
+        draw_image = pygame.Surface(
+            (self._radius * 2, self._radius * 2), pygame.SRCALPHA
+        )
+        if self._border_width > 0:
             pygame.draw.circle(
                 draw_image,
-                _color_name_to_rgb(self._color),
+                _color_name_to_rgb(self._border_color),
                 (self._radius, self._radius),
-                max(self._radius - self._border_width, 0),
+                self._radius,
             )
 
-            draw_image.set_alpha(self._transparency * 2.55)
-
-            self.rect = draw_image.get_rect()
-            pos = convert_pos(self.x, self.y)
-            self.rect.x = pos[0] - self._radius
-            self.rect.y = pos[1] - self._radius
+        pygame.draw.circle(
+            draw_image,
+            _color_name_to_rgb(self._color),
+            (self._radius, self._radius),
+            max(self._radius - self._border_width, 0),
+        )
 
-            if self.physics:
-                angle_deg = -_math.degrees(self.physics._pymunk_body.angle)
-                self._image = pygame.transform.rotate(draw_image, angle_deg)
-                self.rect = self._image.get_rect(center=self.rect.center)
-            else:
-                self._image = draw_image
+        draw_image.set_alpha(self._transparency * 2.55)
+        stats.count("surfaces_allocated")
+        return draw_image
 
-        super().update()
+    def _rotate_image(self):
+        """Turn the circle to the angle of its physics body."""
+        if self.physics:
+            angle_deg = -_math.degrees(self.physics._pymunk_body.angle)
+            self._image = surface_cache.rotate(
+                self._base_key, self._base_image, angle_deg
+            )
+        else:
+            self._image = self._base_image
+        self._rotated_image = self._image
+
+    def _position_rect(self):
+        """Move the circle to its position."""
+        self.rect = self._base_image.get_rect()
+        pos = convert_pos(self.x, self.y)
+        self.rect.x = pos[0] - self._radius
+        self.rect.y = pos[1] - self._radius
+        if self.physics:
+            self.rect = self._rotated_image.get_rect(center=self.rect.center)
 
     ##### color #####
     @property
@@ -100,7 +132,7 @@ class Circle(Sprite):
     def color(self, _color):
         """Set the color of the circle.
         :param _color: The color of the circle."""
-        self._color = _color
+        self._set("_color", _color)
 
     ##### radius #####
     @property
@@ -113,8 +145,7 @@ class Circle(Sprite):
     def radius(self, _radius):
         """Set the radius of the circle.
         :param _radius: The radius of the circle."""
-        self._radius = _radius
-        if self.physics:
+        if self._set("_radius", _radius) and self.physics:
             self.physics._pymunk_shape.unsafe_set_radius(self._radius)
 
     ##### border_color #####
@@ -128,7 +159,7 @@ class Circle(Sprite):
     def border_color(self, _border_color):
         """Set the color of the circle's border.
         :param _border_color: The color of the circle's border."""
-        self._border_color = _border_color
+        self._set("_border_color", _border_color)
 
     ##### border_width #####
     @property
@@ -141,4 +172,4 @@ class Circle(Sprite):
     def border_width(self, _border_width):
         """Set the width of the circle's border.
         :param _border_width: The width of the circle's border."""
-        self._border_width = _border_width
+        self._set("_border_width", _border_width)
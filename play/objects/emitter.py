@@ -0,0 +1,214 @@
+"""This module contains the Emitter class, a particle system simulated with NumPy."""
+
+import numpy as np
+import pygame
+
+from ..globals import globals_list
+from ..io.assets import image_assets
+from ..io.screen import screen
+from ..utils import color_name_to_rgb as _color_name_to_rgb
+from ..utils.scene import scene
+from ..utils.stats import stats
+from ..utils.surface_cache import surface_cache
+
+# particles change color and transparency in this many steps over their life
+LIFE_STEPS = 16
+
+
+class Emitter:  # pylint: disable=too-many-instance-attributes
+    """
+    Sends out particles, for smoke, sparks, rain and explosions. The particles
+    live in NumPy arrays of a fixed size, the oldest particle makes room for a
+    new one once the emitter is full, and all of them are drawn with a single
+    display.blits() call.
+
+    Example:
+
+        sparks = play.new_emitter(rate=200, lifetime=0.5, speed=150, color="yellow",
+                                  end_color="red", gravity=300)
+
+        @play.repeat_forever
+        def follow():
+            sparks.go_to(play.mouse)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-locals
+        self,
+        x=0,
+        y=0,
+        rate=50,
+        lifetime=1,
+        speed=100,
+        speed_spread=0,
+        direction=90,
+        spread=360,
+        gravity=0,
+        color="black",
+        end_color=None,
+        transparency=100,
+        end_transparency=0,
+        radius=3,
+        image=None,
+        max_particles=1000,
+        seed=None,
+    ):
+        if max_particles < 1:
+            raise ValueError("max_particles must be at least 1.")
+        if lifetime <= 0:
+            raise ValueError("lifetime must be a positive number.")
+        self.x = x
+        self.y = y
+        self.rate = rate
+        self.lifetime = lifetime
+        self.speed = speed
+        self.speed_spread = speed_spread
+        self.direction = direction
+        self.spread = spread
+        self.gravity = gravity
+        self.color = color
+        self.end_color = end_color if end_color is not None else color
+        self.transparency = transparency
+        self.end_transparency = end_transparency
+        self.radius = radius
+        self.image = image_assets.load(image) if isinstance(image, str) else image
+        self.emitting = True
+
+        self._random = np.random.default_rng(seed)
+        self._x = np.zeros(max_particles)
+        self._y = np.zeros(max_particles)
+        self._vx = np.zeros(max_particles)
+        self._vy = np.zeros(max_particles)
+        self._age = np.zeros(max_particles)
+        self._alive = np.zeros(max_particles, dtype=bool)
+        self._head = 0
+        self._to_spawn = 0.0
+
+        globals_list.emitters.append(self)
+
+    @property
+    def max_particles(self):
+        """Get the most particles this emitter can have alive at once.
+        :return: The size of the particle buffer."""
+        return len(self._alive)
+
+    @property
+    def live_count(self):
+        """Get the number of particles that are alive.
+        :return: The number of live particles."""
+        return int(np.count_nonzero(self._alive))
+
+    def go_to(self, x=None, y=None):
+        """Move the emitter to a position or to another object.
+        :param x: The x-coordinate, or an object with x and y.
+        :param y: The y-coordinate."""
+        try:
+            x, y = x.x, x.y
+        except AttributeError:
+            pass
+        self.x, self.y = x, y
+
+    def burst(self, count):
+        """Send out a number of particles at once.
+        :param count: The number of particles."""
+        count = min(int(count), self.max_particles)
+        if count <= 0:
+            return
+        index = (self._head + np.arange(count)) % self.max_particles
+        self._head = (self._head + count) % self.max_particles
+
+        angles = np.radians(
+            self.direction
+            + self._random.uniform(-self.spread / 2, self.spread / 2, count)
+        )
+        speeds = self.speed * (
+            1 + self._random.uniform(-self.speed_spread, self.speed_spread, count)
+        )
+        self._x[index] = self.x
+        self._y[index] = self.y
+        self._vx[index] = np.cos(angles) * speeds
+        self._vy[index] = np.sin(angles) * speeds
+        self._age[index] = 0
+        self._alive[index] = True
+
+    def simulate(self, seconds):
+        """Move the particles, send out new ones and let old ones die.
+        :param seconds: The number of seconds that passed."""
+        alive = self._alive
+        self._age[alive] += seconds
+        self._vy[alive] -= self.gravity * seconds
+        self._x[alive] += self._vx[alive] * seconds
+        self._y[alive] += self._vy[alive] * seconds
+        # a small margin, so 30 frames of 1/60 s always add up to half a second
+        alive &= self._age < self.lifetime - 1e-9
+
+        if self.emitting:
+            self._to_spawn += self.rate * seconds
+            count = int(self._to_spawn)
+            self._to_spawn -= count
+            self.burst(count)
+        stats.count("particles_live", self.live_count)
+
+    def clear(self):
+        """Remove all particles."""
+        self._alive[:] = False
+
+    def remove(self):
+        """Remove the emitter and its particles from the screen."""
+        if self in globals_list.emitters:
+            globals_list.emitters.remove(self)
+            scene.mark_dirty()
+
+    def _life_image(self, step):
+        """Get the shared surface of particles in a step of their life.
+        :param step: The step of their life, from 0 to LIFE_STEPS - 1.
+        :return: The surface."""
+        fraction = step / (LIFE_STEPS - 1)
+        alpha = round(
+            (self.transparency + (self.end_transparency - self.transparency) * fraction)
+            * 2.55
+        )
+        if self.image is not None:
+            key = ("particle image", self.image, alpha)
+            return surface_cache.get(key, lambda: self._draw_image(None, alpha))
+
+        start = _color_name_to_rgb(self.color)
+        end = _color_name_to_rgb(self.end_color)
+        color = tuple(round(a + (b - a) * fraction) for a, b in zip(start[:3], end[:3]))
+        key = ("particle", self.radius, color, alpha)
+        return surface_cache.get(key, lambda: self._draw_image(color, alpha))
+
+    def _draw_image(self, color, alpha):
+        """Draw a particle.
+        :param color: The color of the particle, or None to use the image.
+        :param alpha: The alpha value of the particle, from 0 to 255.
+        :return: The drawn surface."""
+        if color is None:
+            image = self.image.copy()
+        else:
+            image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(image, color, (self.radius, self.radius), self.radius)
+        image.set_alpha(alpha)
+        stats.count("surfaces_allocated")
+        return image
+
+    def draw(self, surface):
+        """Draw the live particles.
+        :param surface: The surface to draw on.
+        :return: The number of particles drawn."""
+        alive = np.flatnonzero(self._alive)
+        if len(alive) == 0:
+            return 0
+
+        steps = np.minimum(
+            (self._age[alive] / self.lifetime * LIFE_STEPS).astype(np.int64),
+            LIFE_STEPS - 1,
+        )
+        images = [self._life_image(step) for step in range(LIFE_STEPS)]
+        width, height = images[0].get_size()
+        left = screen.width / 2 + self._x[alive] - width / 2
+        top = screen.height / 2 - self._y[alive] - height / 2
+        positions = np.stack((left, top), axis=1).astype(np.int32).tolist()
+        surface.blits(
+            zip([images[step] for step in steps.tolist()], positions), doreturn=False
+        )
+        return len(alive)
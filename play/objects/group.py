@@ -0,0 +1,108 @@
+"""This module contains the Group class, a set of sprites that events can refer to as a whole."""
+
+from ..callback.callback_helpers import run_async_callback
+from ..utils.spatial_grid import sprite_grid, EVERYTHING
+
+
+class Group:
+    """
+    A set of sprites, like all coins or all enemies. A sprite can subscribe to
+    touching a group once, instead of to every sprite in it, and sprites that
+    join or leave the group later are picked up automatically. A sprite leaves
+    all its groups when it's removed.
+
+    Example:
+
+        coins = play.new_group()
+        for x in range(-300, 300, 50):
+            coins.add(play.new_circle(color="gold", x=x, radius=10))
+
+        @player.when_touching(coins)
+        def collect(coin):
+            coin.remove()
+    """
+
+    def __init__(self, *sprites):
+        # a dict keeps the sprites in the order they were added
+        self._sprites = {}
+        self._count = 0
+        self.add(*sprites)
+
+    def add(self, *sprites):
+        """Add sprites to the group.
+        :param sprites: The sprites to add."""
+        for sprite in sprites:
+            if sprite not in self._sprites:
+                self._sprites[sprite] = self._count
+                self._count += 1
+                sprite._groups.append(self)
+
+    def remove(self, *sprites):
+        """Take sprites out of the group. They stay on the screen.
+        :param sprites: The sprites to take out."""
+        for sprite in sprites:
+            if self._sprites.pop(sprite, None) is not None:
+                sprite._groups.remove(self)
+
+    def sprites(self):
+        """Get the sprites in the group.
+        :return: A list of the sprites, in the order they were added."""
+        return list(self._sprites)
+
+    def __contains__(self, sprite):
+        return sprite in self._sprites
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def touching(self, sprite, collision="rect"):
+        """Find the sprites of the group that a sprite touches, looking only at the
+        sprites near it.
+        :param sprite: The sprite that might touch sprites of the group.
+        :param collision: "rect" or "mask", like in Sprite.is_touching.
+        :return: A list of the touched sprites, in the order they were added."""
+        nearby = sprite_grid.query(sprite.rect)
+        if nearby is EVERYTHING:
+            candidates = self._sprites
+        else:
+            candidates = [other for other in nearby if other in self._sprites]
+        touched = [
+            other
+            for other in candidates
+            if other is not sprite
+            and not other.is_hidden
+            and sprite.is_touching(other, collision)
+        ]
+        touched.sort(key=self._sprites.get)
+        return touched
+
+
+class GroupSubscription:  # pylint: disable=too-few-public-methods
+    """
+    A touching or stopped touching callback of a sprite for a whole group. The
+    callback gets the sprite of the group that was touched.
+    """
+
+    def __init__(self, group, callback, begin=True, collision="rect"):
+        self.group = group
+        self.callback = callback
+        self.begin = begin
+        self.collision = collision
+        self._touching = []
+
+    async def run(self, sprite):
+        """Check which sprites of the group the sprite touches and run the callback.
+        When touching, it runs every frame for every touched sprite. When stopped
+        touching, it runs once for every sprite that isn't touched anymore.
+        :param sprite: The sprite that subscribed."""
+        touching = self.group.touching(sprite, self.collision)
+        if self.begin:
+            changed = touching
+        else:
+            changed = [other for other in self._touching if other not in touching]
+        self._touching = touching
+        for other in changed:
+            await run_async_callback(self.callback, [], ["sprite"], other)
@@ -1,24 +1,42 @@
 """This module contains the Image class, which is a subclass of the Sprite class."""
 
+import asyncio as _asyncio
+import math as _math
 import os
+
 import pygame
 
 from .sprite import Sprite
+from ..io.assets import image_assets
 from ..io.screen import convert_pos
+from ..loop import loop as _loop
+from ..utils.stats import stats
+from ..utils.surface_cache import rotation_cache
 
 
 class Image(Sprite):
+    __slots__ = (
+        "_source_image",
+        "_original_width",
+        "_original_height",
+        "_rotation_step",
+        "_prerender_task",
+    )
+
     def __init__(self, image, x=0, y=0, angle=0, size=100, transparency=100):
         if isinstance(image, str):
             if not os.path.isfile(image):
                 raise FileNotFoundError(f"Image file '{image}' not found.")
-            # Keep the original, loaded image safe from modifications.
-            self._source_image = pygame.image.load(image)
+            # The loaded image is shared with every image of the same file,
+            # so it must never be drawn on.
+            self._source_image = image_assets.load(image)
         else:
             self._source_image = image
 
         # Initialize the parent sprite with this image.
         super().__init__(image=self._source_image)
+        self._rotation_step = None
+        self._prerender_task = None
 
         self._original_width = self._source_image.get_width()
         self._original_height = self._source_image.get_height()
@@ -30,29 +48,97 @@ class Image(Sprite):
         self.rect = self._source_image.get_rect()
         self.update()
 
-    def update(self):
-        """Update the image's position, size, angle, and transparency."""
-        if self._should_recompute:
-            # Generate the display image from the original source
-            draw_image = pygame.transform.scale(
-                self._source_image,
-                (
-                    self._original_width * self._size // 100,
-                    self._original_height * self._size // 100,
-                ),
+    def _render_image(self):
+        """Scale the original image to the size of the sprite."""
+        self._base_image = pygame.transform.scale(
+            self._source_image,
+            (
+                self._original_width * self._size // 100,
+                self._original_height * self._size // 100,
+            ),
+        )
+        stats.count("surfaces_allocated")
+
+    def _rotate_image(self):
+        """Turn the scaled image to the angle of the sprite and apply its transparency."""
+        if self._rotation_step:
+            angle = round(self.angle / self._rotation_step) * self._rotation_step
+            draw_image = rotation_cache.get(
+                self._rotation_key(angle % 360), lambda: self._draw_rotation(angle)
+            )
+        else:
+            draw_image = self._draw_rotation(self.angle)
+
+        # Set the generated image as the sprite's current image
+        self._rotated_image = draw_image
+        self._image = draw_image
+
+    def _draw_rotation(self, angle):
+        """Turn the scaled image and apply the transparency of the sprite.
+        :param angle: The angle in degrees.
+        :return: The turned image."""
+        draw_image = pygame.transform.rotate(self._base_image, angle)
+        stats.count("surfaces_allocated")
+        alpha_value = round(self.transparency * 2.55)
+        draw_image.set_alpha(alpha_value)
+        return draw_image
+
+    def _rotation_key(self, angle):
+        return (
+            "image",
+            self._source_image,
+            self._base_image.get_size(),
+            round(self.transparency * 2.55),
+            angle,
+        )
+
+    def cache_rotations(self, angle_step=5, in_background=False):
+        """
+        Keep turned copies of this image, so turning it costs a lookup instead of
+        turning the pixels again. The angle of the image is rounded to angle_step.
+        Images with the same file and size share their turned copies.
+
+        Example:
+
+            coin = play.new_image("coin.png")
+            coin.cache_rotations(angle_step=10, in_background=True)
+
+            @play.repeat_forever
+            def spin():
+                coin.turn(10)
+
+        :param angle_step: The number of degrees between cached angles, or None to
+            stop caching.
+        :param in_background: If True, turn the image to every angle in the background
+            instead of waiting until it's turned to an angle for the first time.
+        """
+        if angle_step is not None and angle_step <= 0:
+            raise ValueError("angle_step must be a positive number or None.")
+        self._rotation_step = angle_step
+        self._flag(self._turn_flag)
+        if angle_step and in_background:
+            self._prerender_task = _loop.create_task(
+                self._prerender_rotations(angle_step)
             )
-            draw_image = pygame.transform.rotate(draw_image, self.angle)
-            alpha_value = round(self.transparency * 2.55)
-            draw_image.set_alpha(alpha_value)
 
-            # Set the generated image as the sprite's current image
-            self.image = draw_image
-            self.rect = draw_image.get_rect()
-            pos = convert_pos(self.x, self.y)
-            self.rect.center = pos
+    async def _prerender_rotations(self, angle_step):
+        """Fill the rotation cache with every angle of the image, one per loop turn.
+        :param angle_step: The number of degrees between cached angles."""
+        for index in range(_math.ceil(360 / angle_step)):
+            if self._rotation_step != angle_step or self._base_image is None:
+                return
+            angle = index * angle_step
+            rotation_cache.get(
+                self._rotation_key(angle % 360),
+                lambda angle=angle: self._draw_rotation(angle),
+            )
+            await _asyncio.sleep(0)
 
-        # Allow the parent class to handle hiding, collisions, etc.
-        super().update()
+    def _position_rect(self):
+        """Move the image to its position."""
+        self.rect = self._rotated_image.get_rect()
+        pos = convert_pos(self.x, self.y)
+        self.rect.center = pos
 
     # The custom image property is removed to use the parent Sprite's property.
     # This ensures that the image managed by the Pygame sprite group is the
@@ -68,8 +154,8 @@ class Image(Sprite):
         """Set the image from a file."""
         if not os.path.isfile(image):
             raise FileNotFoundError(f"Image file '{image}' not found.")
-        self._source_image = pygame.image.load(image)
+        self._source_image = image_assets.load(image)
         self._original_width = self._source_image.get_width()
         self._original_height = self._source_image.get_height()
-        self._should_recompute = True
+        self._flag()
         self.update()
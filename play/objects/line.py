@@ -4,11 +4,19 @@ import math as _math
 
 import pygame
 from .sprite import Sprite
-from ..io.screen import convert_pos, screen
+from ..io.screen import convert_pos
 from ..utils import color_name_to_rgb as _color_name_to_rgb
+from ..utils.stats import stats
+from ..utils.surface_cache import surface_cache
 
 
 class Line(Sprite):
+    __slots__ = ("_color", "_thickness", "_length", "_x1", "_y1")
+
+    # the surface of a line only covers the line, so moving it means drawing it again
+    _move_flag = "_should_recompute"
+    _turn_flag = "_should_recompute"
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         color="black",
@@ -49,22 +57,45 @@ class Line(Sprite):
         self.rect = pygame.Rect(0, 0, 0, 0)
         self.update()
 
-    def update(self):
-        """Update the line's position and appearance."""
-        if self._should_recompute:
-            pos_begin = convert_pos(self.x, self.y)
-            pos_end = convert_pos(self.x1, self.y1)
-
-            self._image = pygame.Surface((screen.width, screen.height), pygame.SRCALPHA)
-            pygame.draw.line(
-                self._image,
-                _color_name_to_rgb(self._color),
-                pos_begin,
-                pos_end,
-                self._thickness,
-            )
-            self.rect = self._image.get_rect()
-            super().update()
+    def _bounds(self):
+        """Get the part of the screen the line covers, with room for its thickness.
+        :return: The left, top, right and bottom of the line on the screen."""
+        pos_begin = convert_pos(self.x, self.y)
+        pos_end = convert_pos(self.x1, self.y1)
+        padding = self._thickness // 2 + 1
+        return (
+            _math.floor(min(pos_begin[0], pos_end[0])) - padding,
+            _math.floor(min(pos_begin[1], pos_end[1])) - padding,
+            _math.ceil(max(pos_begin[0], pos_end[0])) + padding,
+            _math.ceil(max(pos_begin[1], pos_end[1])) + padding,
+        )
+
+    def _render_image(self):
+        """Draw the line between its two points."""
+        pos_begin = convert_pos(self.x, self.y)
+        pos_end = convert_pos(self.x1, self.y1)
+
+        # the surface only covers the line itself. The points are rounded to whole
+        # pixels, so lines moving by fractions of a pixel share their surfaces.
+        left, top, right, bottom = self._bounds()
+        begin = (round(pos_begin[0] - left), round(pos_begin[1] - top))
+        end = (round(pos_end[0] - left), round(pos_end[1] - top))
+        color = _color_name_to_rgb(self._color)
+
+        def draw_image():
+            image = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+            stats.count("surfaces_allocated")
+            pygame.draw.line(image, color, begin, end, self._thickness)
+            return image
+
+        # lines with the same length, angle, color and thickness share a surface
+        key = ("line", right - left, bottom - top, color, self._thickness, begin, end)
+        self._image = surface_cache.get(key, draw_image)
+
+    def _position_rect(self):
+        """Move the rect to the part of the screen the line covers."""
+        left, top, right, bottom = self._bounds()
+        self.rect = pygame.Rect(left, top, right - left, bottom - top)
 
     def clone(self):
         """Return a clone of the line.
@@ -87,7 +118,7 @@ class Line(Sprite):
     def color(self, _color):
         """Set the color of the line.
         :param _color: The new color of the line."""
-        self._color = _color
+        self._set("_color", _color)
 
     ##### thickness #####
     @property
@@ -100,7 +131,7 @@ class Line(Sprite):
     def thickness(self, _thickness):
         """Set the thickness of the line.
         :param _thickness: The new thickness of the line."""
-        self._thickness = _thickness
+        self._set("_thickness", _thickness)
 
     def _calc_endpoint(self):
         radians = _math.radians(self._angle)
@@ -121,8 +152,8 @@ class Line(Sprite):
     def length(self, _length):
         """Set the length of the line.
         :param _length: The new length of the line."""
-        self._length = _length
-        self._x1, self._y1 = self._calc_endpoint()
+        if self._set("_length", _length):
+            self._x1, self._y1 = self._calc_endpoint()
 
     ##### angle #####
     @property
@@ -135,8 +166,8 @@ class Line(Sprite):
     def angle(self, _angle):
         """Set the angle of the line.
         :param _angle: The new angle of the line."""
-        self._angle = _angle
-        self._x1, self._y1 = self._calc_endpoint()
+        if self._set("_angle", _angle):
+            self._x1, self._y1 = self._calc_endpoint()
         if self.physics:
             self.physics._pymunk_body.angle = _math.radians(_angle)
 
@@ -158,8 +189,8 @@ class Line(Sprite):
     def x1(self, _x1):
         """Set the x-coordinate of the line's endpoint.
         :param _x1: The new x-coordinate of the line's endpoint."""
-        self._x1 = _x1
-        self._length, self._angle = self._calc_length_angle()
+        if self._set("_x1", _x1):
+            self._length, self._angle = self._calc_length_angle()
 
     ##### y1 #####
     @property
@@ -172,5 +203,5 @@ class Line(Sprite):
     def y1(self, _y1):
         """Set the y-coordinate of the line's endpoint.
         :param _y1: The new y-coordinate of the line's endpoint."""
-        self._y1 = _y1
-        self._length, self._angle = self._calc_length_angle()
+        if self._set("_y1", _y1):
+            self._length, self._angle = self._calc_length_angle()
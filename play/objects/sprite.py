@@ -2,6 +2,7 @@
 
 import math as _math
 import warnings as _warnings
+from itertools import count as _count
 
 import pygame
 import pymunk as _pymunk
@@ -9,40 +10,134 @@ import pymunk as _pymunk
 from ..callback import callback_manager, CallbackType
 from ..callback.callback_helpers import run_async_callback
 from ..callback.collision_callbacks import collision_registry, CollisionType
+from .group import Group, GroupSubscription
 from ..globals import globals_list
 from ..io.screen import screen
+from ..io.viewport import viewport
 from ..physics import physics_space, Physics as _Physics
 from ..utils import clamp as _clamp
 from ..utils.async_helpers import make_async
+from ..utils.scene import scene
+from ..utils.spatial_grid import sprite_grid
+from ..utils.stats import stats
 
 
-def _sprite_touching_sprite(a, b):
-    """Check if two sprites are touching.
+COLLISION_MODES = ("rect", "mask")
+
+
+def _check_collision_mode(collision):
+    """Check that a way of checking if sprites touch exists.
+    :param collision: "rect" or "mask"."""
+    if collision not in COLLISION_MODES:
+        raise ValueError(
+            f"Unknown collision {collision!r}. Use one of: {', '.join(COLLISION_MODES)}."
+        )
+
+
+def _sprite_touching_sprite(a, b, collision="rect"):
+    """Check if two sprites are touching. With masks, only sprites whose rects
+    touch have their pixels compared.
     :param a: The first sprite to check if it's touching the other sprite.
     :param b: The second sprite to check if it's touching the other sprite.
+    :param collision: "rect" to compare the rects, "mask" to compare the pixels.
     :return: Whether the two sprites are touching."""
-    return a.rect.colliderect(b.rect)
+    if not a.rect.colliderect(b.rect):
+        return False
+    if collision == "rect":
+        return True
+    mask, other_mask = a._get_mask(), b._get_mask()
+    if mask is None or other_mask is None:
+        return True
+    offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+    return mask.overlap(other_mask, offset) is not None
+
 
+# sprites are drawn in the order they were made, so later sprites are on top
+_draw_order = _count()
 
-def point_touching_sprite(point, sprite):
+
+def _split_groups(targets):
+    """Split the targets of a touching event into groups and sprites.
+    :param targets: Sprites and groups.
+    :return: A list of the groups and a list of the sprites."""
+    groups = [target for target in targets if isinstance(target, Group)]
+    return groups, [target for target in targets if not isinstance(target, Group)]
+
+
+def point_touching_sprite(point, sprite, collision="rect"):
     """Check if a point is touching a sprite.
     :param point: The point to check if it's touching the sprite.
     :param sprite: The sprite to check if it's touching the point.
+    :param collision: "rect" to check the rect, "mask" to check the pixel.
     :return: Whether the point is touching the sprite."""
-    return sprite.rect.collidepoint(point)
-
-
-_should_ignore_update = [
-    "_should_recompute",
-    "rect",
-    "_image",
-]
+    if not sprite.rect.collidepoint(point):
+        return False
+    if collision == "rect":
+        return True
+    # a hidden sprite has no pixels to touch
+    if sprite.is_hidden:
+        return False
+    mask = sprite._get_mask()
+    if mask is None:
+        return True
+    x, y = int(point[0]) - sprite.rect.x, int(point[1]) - sprite.rect.y
+    width, height = mask.get_size()
+    if not (0 <= x < width and 0 <= y < height):
+        return False
+    return bool(mask.get_at((x, y)))
 
 
 class Sprite(
-    pygame.sprite.Sprite
+    pygame.sprite.DirtySprite
 ):  # pylint: disable=attribute-defined-outside-init, too-many-public-methods
+    # the attributes of every sprite live in slots instead of a __dict__, which
+    # keeps them small and quick to read and write. pygame's own Sprite class has
+    # no slots, so a __dict__ is still there for attributes users add themselves.
+    __slots__ = (
+        "_should_recompute",
+        "_should_rotate",
+        "_should_move",
+        "_size",
+        "_x",
+        "_y",
+        "_angle",
+        "_transparency",
+        "_dependent_sprites",
+        "_touching_callback",
+        "_stopped_callback",
+        "_image",
+        "_base_image",
+        "_rotated_image",
+        "_rotated_rect",
+        "physics",
+        "_is_clicked",
+        "_is_hidden",
+        "_has_image",
+        "_is_deferred",
+        "_groups",
+        "_group_subscriptions",
+        "_draw_order",
+        "_mask",
+        "_mask_image",
+        # set by pygame.sprite.Sprite and DirtySprite, these are their private names
+        "_Sprite__g",
+        "_Sprite__image",
+        "_Sprite__rect",
+        "dirty",
+        "blendmode",
+        "source_rect",
+        "_visible",
+        "_layer",
+    )
+
+    # which flag of update() is set when the sprite moves or turns. Moving or
+    # turning only moves or turns its image, anything else draws it again.
+    _move_flag = "_should_move"
+    _turn_flag = "_should_rotate"
+
     def __init__(self, image=None):
+        self._should_move = False
+        self._should_rotate = False
         self._size = None
         self._x = None
         self._y = None
@@ -52,25 +147,49 @@ class Sprite(
         self._dependent_sprites = []
         self._touching_callback = [None, None]
         self._stopped_callback = [None, None]
+        self._groups = []
+        self._group_subscriptions = []
+        self._draw_order = next(_draw_order)
+        self._mask = None
+        self._mask_image = None
 
         self._image = image
+        self._base_image = None
+        self._rotated_image = None
+        self._rotated_rect = None
         self.physics: _Physics | None = None
         self._is_clicked = False
         self._is_hidden = False
+        self._has_image = False
+        self._is_deferred = False
         self._should_recompute = True
 
         self.rect = None
 
         super().__init__()
         globals_list.sprites_group.add(self)
-
-    def __setattr__(self, name, value):
-        # ignore if it's in the ignored list or if the variable doesn't change
-        if name not in _should_ignore_update and getattr(self, name, value) != value:
-            self._should_recompute = True
-            for sprite in self._dependent_sprites:
-                sprite._should_recompute = True
-        super().__setattr__(name, value)
+        scene.mark_dirty()
+
+    def _flag(self, flag="_should_recompute"):
+        """Update the sprite in the next frame, and let the sprites that check if
+        they touch it check again.
+        :param flag: "_should_move", "_should_rotate" or "_should_recompute"."""
+        setattr(self, flag, True)
+        scene.mark_dirty()
+        for sprite in self._dependent_sprites:
+            sprite._should_move = True
+
+    def _set(self, name, value, flag="_should_recompute"):
+        """Change an attribute, updating the sprite only if its value changed.
+        :param name: The name of the attribute, like "_color".
+        :param value: The new value of the attribute.
+        :param flag: The flag to set if the value changed.
+        :return: Whether the value changed."""
+        if getattr(self, name) == value:
+            return False
+        setattr(self, name, value)
+        self._flag(flag)
+        return True
 
     def is_touching_wall(self) -> bool:
         """Check if the sprite is touching the edge of the screen.
@@ -89,19 +208,59 @@ class Sprite(
                 return True
         return False
 
+    def _render_image(self):
+        """Draw the image of the sprite, before it is turned. Sprites that draw
+        themselves override this and store the image in self._base_image."""
+
+    def _rotate_image(self):
+        """Turn the image drawn by _render_image and store it in self._image."""
+
+    def _position_rect(self):
+        """Move self.rect to the position of the sprite."""
+
+    def _is_off_screen(self):
+        """Move the rect of the sprite with the image it already has, and check if
+        it is outside the screen while culling is on.
+        :return: True if drawing the image again can wait."""
+        if not viewport.culling or not self._has_image:
+            return False
+        self._position_rect()
+        return not viewport.is_visible(self.rect)
+
     def update(self):  # pylint: disable=too-many-branches
-        """Update the sprite."""
-        if not self._should_recompute:
+        """Update the sprite. Its image is only drawn again when its appearance
+        changed, and only turned again when its angle changed, moving the sprite
+        just moves its rect. With culling on, a sprite off the screen keeps its
+        old image until it comes back."""
+        if not (self._should_recompute or self._should_rotate or self._should_move):
             return
-
-        # Check if we are touching any other sprites
-        for callback, b in callback_manager.get_callback(
+        stats.count("sprites_updated")
+        deferred = (
+            self._should_recompute or self._should_rotate
+        ) and self._is_off_screen()
+        self._is_deferred = deferred
+        if not deferred:
+            if self._should_recompute:
+                stats.count("sprites_rerendered")
+                self._render_image()
+            if self._should_recompute or self._should_rotate:
+                self._rotate_image()
+            self._position_rect()
+            self._has_image = True
+        self.dirty = 1
+        sprite_grid.move(self, self.rect)
+
+        # Check if we are touching any other sprites. Sprites that aren't in the
+        # grid cells of this sprite can't touch it, so their rects aren't tested.
+        registrations = callback_manager.get_callback(
             [CallbackType.WHEN_TOUCHING, CallbackType.WHEN_STOPPED_TOUCHING],
             id(self),
-        ):
+        )
+        nearby = sprite_grid.query(self.rect) if registrations else set()
+        for callback, b in registrations:
             if self.physics and b.physics:
                 continue
-            if self.is_touching(b):
+            if b in nearby and self.is_touching(b, callback.collision):
                 if not callable(self._touching_callback[CollisionType.SPRITE]):
                     if callback.type == CallbackType.WHEN_TOUCHING:
                         self._touching_callback[CollisionType.SPRITE] = callback
@@ -129,7 +288,11 @@ class Sprite(
 
         if self._is_hidden:
             self._image = pygame.Surface((0, 0), pygame.SRCALPHA)
-        self._should_recompute = False
+            stats.count("surfaces_allocated")
+        if not deferred:
+            self._should_recompute = False
+            self._should_rotate = False
+        self._should_move = False
 
     @property
     def is_clicked(self):
@@ -159,7 +322,7 @@ class Sprite(
     def x(self, _x):
         """Set the x-coordinate of the sprite.
         :param _x: The x-coordinate of the sprite."""
-        self._x = _x
+        self._set("_x", _x, self._move_flag)
         if self.physics:
             self.physics._pymunk_body.position = self._x, self._y
             if self.physics._pymunk_body.body_type == _pymunk.Body.STATIC:
@@ -175,7 +338,7 @@ class Sprite(
     def y(self, _y):
         """Set the y-coordinate of the sprite.
         :param _y: The y-coordinate of the sprite."""
-        self._y = _y
+        self._set("_y", _y, self._move_flag)
         if self.physics:
             self.physics._pymunk_body.position = self._x, self._y
             if self.physics._pymunk_body.body_type == _pymunk.Body.STATIC:
@@ -204,7 +367,7 @@ You might want to look in your code where you're setting transparency and make s
                 Warning,
             )
 
-        self._transparency = _clamp(alpha, 0, 100)
+        self._set("_transparency", _clamp(alpha, 0, 100))
 
     @property
     def image(self):
@@ -216,7 +379,7 @@ You might want to look in your code where you're setting transparency and make s
     def image(self, image_filename):
         """Set the image of the sprite.
         :param image_filename: The filename of the image to set."""
-        self._image = image_filename
+        self._set("_image", image_filename)
 
     @property
     def angle(self):
@@ -228,7 +391,7 @@ You might want to look in your code where you're setting transparency and make s
     def angle(self, _angle):
         """Set the angle of the sprite.
         :param _angle: The angle of the sprite."""
-        self._angle = _angle
+        self._set("_angle", _angle, self._turn_flag)
 
         if self.physics:
             self.physics._pymunk_body.angle = _math.radians(_angle)
@@ -243,21 +406,19 @@ You might want to look in your code where you're setting transparency and make s
     def size(self, percent):
         """Set the size of the sprite.
         :param percent: The size of the sprite as a percentage."""
-        self._should_recompute = True
-        self._size = percent
-        if self.physics:
+        if self._set("_size", percent) and self.physics:
             self.physics._remove()
             self.physics._make_pymunk()
 
     def hide(self):
         """Hide the sprite."""
-        self._is_hidden = True
+        self._set("_is_hidden", True)
         if self.physics:
             self.physics.pause()
 
     def show(self):
         """Show the sprite."""
-        self._is_hidden = False
+        self._set("_is_hidden", False)
         if self.physics:
             self.physics.unpause()
 
@@ -271,7 +432,7 @@ You might want to look in your code where you're setting transparency and make s
     def is_hidden(self, hide):
         """Set whether the sprite is hidden.
         :param hide: Whether the sprite is hidden."""
-        self._is_hidden = hide
+        self._set("_is_hidden", hide)
 
     @property
     def is_shown(self):
@@ -283,24 +444,39 @@ You might want to look in your code where you're setting transparency and make s
     def is_shown(self, show):
         """Set whether the sprite is shown.
         :param show: Whether the sprite is shown."""
-        self._is_hidden = not show
-
-    def is_touching(self, sprite_or_point):
+        self._set("_is_hidden", not show)
+
+    def _get_mask(self):
+        """Get the mask of the pixels of the sprite that aren't transparent. It's
+        made the first time it's needed and kept until the image changes.
+        :return: A pygame.mask.Mask, or None if the sprite has no image yet."""
+        image = self._image
+        if not isinstance(image, pygame.Surface):
+            return None
+        if self._mask_image is not image:
+            self._mask = pygame.mask.from_surface(image)
+            self._mask_image = image
+            stats.count("masks_built")
+        return self._mask
+
+    def is_touching(self, sprite_or_point, collision="rect"):
         """Check if the sprite is touching another sprite or a point.
         :param sprite_or_point: The sprite or point to check if it's touching.
+        :param collision: "rect" to check if the rects of the sprites touch, or "mask"
+            to check if pixels that aren't transparent touch, for turned, round or
+            partly transparent sprites. Sprites with physics use their shapes.
         :return: Whether the sprite is touching the other sprite or point."""
+        _check_collision_mode(collision)
         if isinstance(sprite_or_point, Sprite):
             if self.physics and sprite_or_point.physics:
-                return (
-                    len(
-                        self.physics._pymunk_shape.shapes_collide(
-                            sprite_or_point.physics._pymunk_shape
-                        ).points
-                    )
-                    > 0
-                )
-            return _sprite_touching_sprite(self, sprite_or_point)
-        return point_touching_sprite(sprite_or_point, self)
+                shape = self.physics._pymunk_shape
+                other_shape = sprite_or_point.physics._pymunk_shape
+                # bodies that bounced off each other during this frame touched too
+                return len(
+                    shape.shapes_collide(other_shape).points
+                ) > 0 or collision_registry.touched(shape, other_shape)
+            return _sprite_touching_sprite(self, sprite_or_point, collision)
+        return point_touching_sprite(sprite_or_point, self, collision)
 
     def point_towards(self, x, y=None):
         """Point the sprite towards a point or another sprite.
@@ -358,6 +534,10 @@ You might want to look in your code where you're setting transparency and make s
         if self.physics:
             self.physics._remove()
         globals_list.sprites_group.remove(self)
+        sprite_grid.remove(self)
+        for group in list(self._groups):
+            group.remove(self)
+        scene.mark_dirty()
 
     @property
     def width(self):
@@ -431,6 +611,34 @@ You might want to look in your code where you're setting transparency and make s
         :param callback: The function to run.
         :param call_with_sprite: Whether to call the function with the sprite as an argument.
         """
+        return self._add_mouse_callback(
+            CallbackType.WHEN_CLICKED_SPRITE, callback, call_with_sprite
+        )
+
+    def when_mouse_over(self, callback, call_with_sprite=False):
+        """Run a function when the mouse pointer moves onto the sprite.
+        :param callback: The function to run.
+        :param call_with_sprite: Whether to call the function with the sprite as an argument.
+        """
+        return self._add_mouse_callback(
+            CallbackType.WHEN_MOUSE_OVER_SPRITE, callback, call_with_sprite
+        )
+
+    def when_mouse_leave(self, callback, call_with_sprite=False):
+        """Run a function when the mouse pointer moves off the sprite.
+        :param callback: The function to run.
+        :param call_with_sprite: Whether to call the function with the sprite as an argument.
+        """
+        return self._add_mouse_callback(
+            CallbackType.WHEN_MOUSE_LEAVE_SPRITE, callback, call_with_sprite
+        )
+
+    def _add_mouse_callback(self, callback_type, callback, call_with_sprite):
+        """Register a function for a mouse event of the sprite.
+        :param callback_type: The type of the mouse event.
+        :param callback: The function to run.
+        :param call_with_sprite: Whether to call the function with the sprite as an argument.
+        :return: The wrapper that runs the function."""
         async_callback = make_async(callback)
 
         async def wrapper():
@@ -451,19 +659,26 @@ You might want to look in your code where you're setting transparency and make s
             wrapper.is_running = False
 
         wrapper.is_running = False
-        callback_manager.add_callback(
-            CallbackType.WHEN_CLICKED_SPRITE, wrapper, id(self)
-        )
+        callback_manager.add_callback(callback_type, wrapper, id(self))
         return wrapper
 
-    def when_touching(self, *sprites):
+    def when_touching(self, *sprites, collision="rect"):
         """Run a function when the sprite is touching another sprite.
-        :param sprites: The sprites to check if they're touching.
+        When touching a group, the function runs for every sprite of the group it
+        touches, and can take that sprite as an argument.
+        :param sprites: The sprites or groups to check if they're touching.
+        :param collision: "rect" or "mask", like in is_touching.
         BEWARE: This function will yield the game loop until the given function returns.
         """
+        _check_collision_mode(collision)
+        groups, sprites = _split_groups(sprites)
 
         def decorator(func):
             async_callback = make_async(func)
+            for group in groups:
+                self._group_subscriptions.append(
+                    GroupSubscription(group, async_callback, collision=collision)
+                )
 
             if self.physics:
                 for sprite in sprites:
@@ -489,6 +704,7 @@ You might want to look in your code where you're setting transparency and make s
                 async def wrapper_func():
                     await wrapper()
 
+                wrapper_func.collision = collision
                 sprite._dependent_sprites.append(self)
                 callback_manager.add_callback(
                     CallbackType.WHEN_TOUCHING, (wrapper_func, sprite), id(self)
@@ -497,13 +713,24 @@ You might want to look in your code where you're setting transparency and make s
 
         return decorator
 
-    def when_stopped_touching(self, *sprites):
+    def when_stopped_touching(self, *sprites, collision="rect"):
         """Run a function when the sprite is no longer touching another sprite.
-        :param sprites: The sprites to check if they're touching.
+        When touching a group, the function runs for every sprite of the group it
+        stopped touching, and can take that sprite as an argument.
+        :param sprites: The sprites or groups to check if they're touching.
+        :param collision: "rect" or "mask", like in is_touching.
         """
+        _check_collision_mode(collision)
+        groups, sprites = _split_groups(sprites)
 
         def decorator(func):
             async_callback = make_async(func)
+            for group in groups:
+                self._group_subscriptions.append(
+                    GroupSubscription(
+                        group, async_callback, begin=False, collision=collision
+                    )
+                )
 
             if self.physics:
                 for sprite in sprites:
@@ -530,6 +757,7 @@ You might want to look in your code where you're setting transparency and make s
                 async def wrapper_func():
                     await wrapper()
 
+                wrapper_func.collision = collision
                 sprite._dependent_sprites.append(self)
                 callback_manager.add_callback(
                     CallbackType.WHEN_STOPPED_TOUCHING, (wrapper_func, sprite), id(self)
@@ -644,6 +872,8 @@ You might want to look in your code where you're setting transparency and make s
                 mass,
                 friction,
             )
+            # the image of a sprite with physics also turns with its body
+            self._flag(self._turn_flag)
 
             # Get all the current callbacks and add them to the new physics object
             when_touching = (
@@ -666,16 +896,21 @@ You might want to look in your code where you're setting transparency and make s
                 )
                 or []
             )
-            for callback, sprite in when_touching:
-                self.when_touching(sprite)(callback)
-            for callback in when_touching_wall:
+            # registering adds to these lists, so go through copies of them
+            for callback, sprite in list(when_touching):
+                self.when_touching(
+                    sprite, collision=getattr(callback, "collision", "rect")
+                )(callback)
+            for callback in list(when_touching_wall):
                 self.when_touching_wall(callback)
-            for callback, sprite in when_stopped_touching:
-                self.when_stopped_touching(sprite)(callback)
-            for callback in when_stopped_touching_wall:
+            for callback, sprite in list(when_stopped_touching):
+                self.when_stopped_touching(
+                    sprite, collision=getattr(callback, "collision", "rect")
+                )(callback)
+            for callback in list(when_stopped_touching_wall):
                 self.when_stopped_touching_wall(callback)
 
     def stop_physics(self):
         """Stop the physics simulation for this sprite."""
         self.physics._remove()
-        self.physics = None
+        self._set("physics", None, self._turn_flag)
@@ -0,0 +1,245 @@
+"""This module contains the SpriteBatch class, thousands of identical sprites kept in arrays."""
+
+from itertools import repeat as _repeat
+
+import numpy as np
+import pygame
+
+from ..globals import globals_list
+from ..io.screen import screen
+from ..utils import color_name_to_rgb as _color_name_to_rgb
+from ..utils.scene import scene
+from ..utils.stats import stats
+from ..utils.surface_cache import surface_cache
+
+SHAPES = ("circle", "box")
+
+
+class SpriteBatch:
+    """
+    A lot of sprites of the same shape, for bullets, stars and particles. Their
+    positions, speeds, angles, colors and visibility are NumPy arrays, so they
+    can be changed all at once, and they are drawn with a single display.blits()
+    call over shared surfaces. They don't have events or physics.
+
+    Example:
+
+        stars = play.new_sprite_batch("circle", count=5000, radius=2, color="white")
+        stars.x = np.random.uniform(-400, 400, 5000)
+        stars.vy = -50
+
+        @play.repeat_forever
+        def fall():
+            stars.y += stars.vy / 60
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        shape="circle",
+        count=100,
+        color="black",
+        radius=10,
+        width=10,
+        height=10,
+        x=0,
+        y=0,
+        angle=0,
+        transparency=100,
+    ):
+        if shape not in SHAPES:
+            raise ValueError(
+                f"Unknown sprite batch shape '{shape}', use one of: {', '.join(SHAPES)}."
+            )
+        if count < 0:
+            raise ValueError("count can't be negative.")
+        self.shape = shape
+        self.radius = radius
+        self.width = width
+        self.height = height
+        self.transparency = transparency
+
+        self._x = np.full(count, x, dtype=np.float64)
+        self._y = np.full(count, y, dtype=np.float64)
+        self._vx = np.zeros(count, dtype=np.float64)
+        self._vy = np.zeros(count, dtype=np.float64)
+        self._angle = np.full(count, angle, dtype=np.float64)
+        self._visible = np.ones(count, dtype=bool)
+        self._colors = np.empty((count, 3), dtype=np.uint8)
+        self._colors[:] = _color_name_to_rgb(color)[:3]
+
+        globals_list.batches.append(self)
+
+    def __len__(self):
+        return len(self._x)
+
+    @property
+    def x(self):
+        """Get the x-coordinates of the sprites.
+        :return: A NumPy array with an x-coordinate per sprite."""
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        """Set the x-coordinates of the sprites.
+        :param value: A number, or an array with a number per sprite."""
+        self._x[:] = value
+
+    @property
+    def y(self):
+        """Get the y-coordinates of the sprites.
+        :return: A NumPy array with a y-coordinate per sprite."""
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        """Set the y-coordinates of the sprites.
+        :param value: A number, or an array with a number per sprite."""
+        self._y[:] = value
+
+    @property
+    def vx(self):
+        """Get the horizontal speeds of the sprites, in pixels per second.
+        :return: A NumPy array with a speed per sprite."""
+        return self._vx
+
+    @vx.setter
+    def vx(self, value):
+        """Set the horizontal speeds of the sprites, in pixels per second.
+        :param value: A number, or an array with a number per sprite."""
+        self._vx[:] = value
+
+    @property
+    def vy(self):
+        """Get the vertical speeds of the sprites, in pixels per second.
+        :return: A NumPy array with a speed per sprite."""
+        return self._vy
+
+    @vy.setter
+    def vy(self, value):
+        """Set the vertical speeds of the sprites, in pixels per second.
+        :param value: A number, or an array with a number per sprite."""
+        self._vy[:] = value
+
+    @property
+    def angle(self):
+        """Get the angles of the sprites. Only boxes are turned.
+        :return: A NumPy array with an angle in degrees per sprite."""
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        """Set the angles of the sprites.
+        :param value: A number, or an array with a number per sprite."""
+        self._angle[:] = value
+
+    @property
+    def visible(self):
+        """Get which sprites are drawn.
+        :return: A NumPy array of booleans."""
+        return self._visible
+
+    @visible.setter
+    def visible(self, value):
+        """Set which sprites are drawn.
+        :param value: A boolean, or an array with a boolean per sprite."""
+        self._visible[:] = value
+
+    @property
+    def colors(self):
+        """Get the colors of the sprites.
+        :return: A NumPy array with a row of red, green and blue per sprite."""
+        return self._colors
+
+    @colors.setter
+    def colors(self, value):
+        """Set the colors of the sprites.
+        :param value: A color name or tuple for every sprite, or an array with a row of
+            red, green and blue per sprite."""
+        if isinstance(value, (str, tuple)):
+            value = _color_name_to_rgb(value)[:3]
+        self._colors[:] = value
+
+    def move(self, seconds=None):
+        """Move every sprite by its speed.
+        :param seconds: How many seconds of movement, one frame if None."""
+        if seconds is None:
+            seconds = 1 / globals_list.FRAME_RATE
+        self._x += self._vx * seconds
+        self._y += self._vy * seconds
+
+    def remove(self):
+        """Remove the batch from the screen."""
+        if self in globals_list.batches:
+            globals_list.batches.remove(self)
+            scene.mark_dirty()
+
+    def _draw_image(self, color):
+        """Draw the shape of the batch in a color.
+        :param color: The color as red, green and blue.
+        :return: The drawn surface."""
+        if self.shape == "circle":
+            image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(image, color, (self.radius, self.radius), self.radius)
+        else:
+            image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            image.fill(color)
+        if self.transparency < 100:
+            image.set_alpha(round(self.transparency * 2.55))
+        stats.count("surfaces_allocated")
+        return image
+
+    def _image(self, packed_color, angle):
+        """Get the shared surface of a color and angle from the surface cache.
+        :param packed_color: The color packed into one number.
+        :param angle: The rounded angle in degrees.
+        :return: The surface."""
+        color = (packed_color >> 16 & 255, packed_color >> 8 & 255, packed_color & 255)
+        key = (
+            "batch",
+            self.shape,
+            self.radius,
+            self.width,
+            self.height,
+            self.transparency,
+            color,
+        )
+        image = surface_cache.get(key, lambda: self._draw_image(color))
+        if self.shape == "box":
+            image = surface_cache.rotate(key, image, angle)
+        return image
+
+    def draw(self, surface):
+        """Draw the visible sprites of the batch.
+        :param surface: The surface to draw on.
+        :return: The number of sprites drawn."""
+        visible = np.flatnonzero(self._visible)
+        if len(visible) == 0:
+            return 0
+
+        # sprites with the same color and rounded angle share a surface
+        colors = self._colors[visible].astype(np.int64)
+        keys = colors[:, 0] << 16 | colors[:, 1] << 8 | colors[:, 2]
+        turns = 1
+        if self.shape == "box":
+            turns = max(round(360 / surface_cache.angle_step), 1)
+            steps = np.round(self._angle[visible] / surface_cache.angle_step)
+            keys = keys * turns + steps.astype(np.int64) % turns
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+
+        images = [
+            self._image(int(key) // turns, int(key) % turns * surface_cache.angle_step)
+            for key in unique_keys
+        ]
+        half_widths = np.array([image.get_width() / 2 for image in images])[inverse]
+        half_heights = np.array([image.get_height() / 2 for image in images])[inverse]
+        left = screen.width / 2 + self._x[visible] - half_widths
+        top = screen.height / 2 - self._y[visible] - half_heights
+        positions = np.stack((left, top), axis=1).astype(np.int32).tolist()
+
+        if len(images) == 1:
+            surface.blits(zip(_repeat(images[0]), positions), doreturn=False)
+        else:
+            surface.blits(
+                zip([images[i] for i in inverse.tolist()], positions), doreturn=False
+            )
+        return len(visible)
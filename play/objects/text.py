@@ -6,9 +6,20 @@ from .sprite import Sprite
 from ..io.screen import convert_pos
 from ..utils import color_name_to_rgb as _color_name_to_rgb
 from ..io.logging import play_logger
+from ..utils.stats import stats
+from ..utils.surface_cache import surface_cache
 
 
 class Text(Sprite):
+    __slots__ = (
+        "_font",
+        "_font_size",
+        "_pygame_font",
+        "_words",
+        "_color",
+        "_when_clicked_callbacks",
+    )
+
     def __init__(
         self,
         words="",
@@ -45,21 +56,41 @@ class Text(Sprite):
         self.rect = pygame.Rect(0, 0, 0, 0)
         self.update()
 
-    def update(self):
-        """Update the text object."""
-        if self._should_recompute:
-            pos = convert_pos(self.x, self.y)
-            self._image = self._pygame_font.render(
-                self._words, True, _color_name_to_rgb(self._color)
-            )
-            # Apply transparency
-            self._image.set_alpha(int(self.transparency * 255))
-            self.rect = self._image.get_rect()
-            self.rect.topleft = (
-                pos[0] - self.rect.width // 2,
-                pos[1] - self.rect.height // 2,
-            )
-            super().update()
+    def _render_image(self):
+        """Get the rendered words from the surface cache."""
+        key = (
+            "text",
+            self._font,
+            self._font_size,
+            self._words,
+            _color_name_to_rgb(self._color),
+            int(self.transparency * 255),
+        )
+        self._base_image = surface_cache.get(key, self._draw_image)
+
+    def _draw_image(self):
+        """Render the words with the font, color and transparency of the text.
+        :return: The rendered surface."""
+        image = self._pygame_font.render(
+            self._words, True, _color_name_to_rgb(self._color)
+        )
+        stats.count("surfaces_allocated")
+        # Apply transparency
+        image.set_alpha(int(self.transparency * 255))
+        return image
+
+    def _rotate_image(self):
+        """Text isn't turned, so the rendered words are the image."""
+        self._image = self._base_image
+
+    def _position_rect(self):
+        """Move the text to its position."""
+        pos = convert_pos(self.x, self.y)
+        self.rect = self._base_image.get_rect()
+        self.rect.topleft = (
+            pos[0] - self.rect.width // 2,
+            pos[1] - self.rect.height // 2,
+        )
 
     def clone(self):
         return self.__class__(
@@ -78,7 +109,7 @@ class Text(Sprite):
     @words.setter
     def words(self, string):
         """Set the words of the text object."""
-        self._words = str(string)
+        self._set("_words", str(string))
 
     @property
     def font(self):
@@ -88,8 +119,8 @@ class Text(Sprite):
     @font.setter
     def font(self, font_name):
         """Set the font of the text object. This will load the font dynamically."""
-        self._font = font_name
-        self._load_font(font_name, self._font_size)
+        if self._set("_font", font_name):
+            self._load_font(font_name, self._font_size)
 
     @property
     def font_size(self):
@@ -99,8 +130,8 @@ class Text(Sprite):
     @font_size.setter
     def font_size(self, size):
         """Set the font size of the text object."""
-        self._font_size = size
-        self._load_font(self._font, size)
+        if self._set("_font_size", size):
+            self._load_font(self._font, size)
 
     @property
     def color(self):
@@ -110,7 +141,7 @@ class Text(Sprite):
     @color.setter
     def color(self, color_):
         """Set the color of the text object."""
-        self._color = color_
+        self._set("_color", color_)
 
     def _load_font(self, font_name, font_size):
         """Helper method to load a font, either from a file or system."""
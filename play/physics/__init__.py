@@ -290,3 +290,35 @@ def set_physics_simulation_steps(num_steps: int) -> None:
     :param num_steps: The number of simulation steps.
     """
     globals_list.num_sim_steps = num_steps
+
+
+def set_adaptive_physics_steps(max_steps: int = 10, enabled: bool = True) -> None:
+    """
+    Let the physics engine pick the number of simulation steps every frame.
+    Slow scenes use a single step, fast objects get more steps so they don't pass
+    through each other, but never more than max_steps or than fit in the frame.
+    :param max_steps: The maximum number of simulation steps per frame.
+    :param enabled: Whether the number of steps is picked automatically.
+    """
+    if max_steps < 1:
+        raise ValueError("max_steps must be at least 1.")
+    globals_list.adaptive_sim_steps = enabled
+    globals_list.max_sim_steps = max_steps
+
+
+def set_fixed_timestep(
+    physics_rate: int = 60, max_steps_per_frame: int = 5, enabled: bool = True
+) -> None:
+    """
+    Advance the physics engine in constant ticks, independent of the frame rate.
+    :param physics_rate: The number of physics ticks per second.
+    :param max_steps_per_frame: The maximum number of catch-up ticks in a single frame.
+    :param enabled: Whether the fixed timestep is used. If False, physics advances once per frame.
+    """
+    if physics_rate <= 0:
+        raise ValueError("physics_rate must be a positive number.")
+    if max_steps_per_frame < 1:
+        raise ValueError("max_steps_per_frame must be at least 1.")
+    globals_list.fixed_timestep = enabled
+    globals_list.physics_rate = physics_rate
+    globals_list.max_physics_steps_per_frame = max_steps_per_frame
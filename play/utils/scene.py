@@ -0,0 +1,31 @@
+"""Keeps track of whether anything on the screen changed since the last drawn frame."""
+
+
+class SceneTracker:  # pylint: disable=too-few-public-methods
+    """
+    Sprites, the backdrop and the window mark the scene as dirty when something
+    visible about them changes. The game loop only fills, draws and flips the
+    screen when the scene is dirty, so a program where nothing moves uses next to
+    no CPU. Set enabled to False to draw every frame, for example when drawing
+    on the screen with pygame directly.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.dirty = True
+
+    def mark_dirty(self):
+        """Draw the screen again in the next frame."""
+        self.dirty = True
+
+    def needs_drawing(self):
+        """Check if the screen has to be drawn.
+        :return: True if something changed since the last drawn frame."""
+        return self.dirty or not self.enabled
+
+    def drawn(self):
+        """Start tracking the changes for the next frame, once a frame is shown."""
+        self.dirty = False
+
+
+scene = SceneTracker()
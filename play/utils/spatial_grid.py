@@ -0,0 +1,100 @@
+"""A uniform grid of the sprites on the screen, to find the sprites near a sprite."""
+
+
+class _Everything:  # pylint: disable=too-few-public-methods
+    """What a disabled grid finds: every sprite might be near."""
+
+    def __contains__(self, sprite):
+        return True
+
+
+EVERYTHING = _Everything()
+
+
+class SpatialGrid:
+    """
+    Splits the screen into square cells and remembers which sprites cover which
+    cells. Finding the sprites that might touch a sprite then only looks at the
+    cells it covers instead of at every sprite. A sprite is only moved to other
+    cells when its rect moved far enough to cover different cells.
+    """
+
+    def __init__(self, cell_size=128):
+        self.enabled = True
+        self.cell_size = cell_size
+        self._cells = {}
+        self._ranges = {}
+
+    def _cell_range(self, rect):
+        """Get the cells a rect covers.
+        :param rect: A pygame.Rect in the coordinates of the screen surface.
+        :return: The first and last column and row."""
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            max(rect.right - 1, rect.left) // size,
+            max(rect.bottom - 1, rect.top) // size,
+        )
+
+    def _cells_in(self, cell_range):
+        left, top, right, bottom = cell_range
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                yield column, row
+
+    def move(self, sprite, rect):
+        """Put a sprite in the cells its rect covers.
+        :param sprite: The sprite.
+        :param rect: The rect of the sprite, or None to take it out of the grid."""
+        if rect is None:
+            self.remove(sprite)
+            return
+        cell_range = self._cell_range(rect)
+        old_range = self._ranges.get(sprite)
+        if cell_range == old_range:
+            return
+        if old_range is not None:
+            self.remove(sprite)
+        self._ranges[sprite] = cell_range
+        for cell in self._cells_in(cell_range):
+            self._cells.setdefault(cell, set()).add(sprite)
+
+    def remove(self, sprite):
+        """Take a sprite out of the grid.
+        :param sprite: The sprite."""
+        cell_range = self._ranges.pop(sprite, None)
+        if cell_range is None:
+            return
+        for cell in self._cells_in(cell_range):
+            sprites = self._cells[cell]
+            sprites.discard(sprite)
+            if not sprites:
+                del self._cells[cell]
+
+    def query(self, rect):
+        """Find the sprites that might touch a rect.
+        :param rect: A pygame.Rect in the coordinates of the screen surface.
+        :return: A set of the sprites in the cells the rect covers, or EVERYTHING if
+            the grid is disabled."""
+        if not self.enabled or rect is None:
+            return EVERYTHING
+        nearby = set()
+        for cell in self._cells_in(self._cell_range(rect)):
+            sprites = self._cells.get(cell)
+            if sprites:
+                nearby |= sprites
+        return nearby
+
+    def info(self):
+        """Get the statistics of the grid.
+        :return: A dictionary with the number of sprites and of cells in use."""
+        return {"sprites": len(self._ranges), "cells": len(self._cells)}
+
+    def clear(self):
+        """Take every sprite out of the grid."""
+        self._cells.clear()
+        self._ranges.clear()
+
+
+sprite_grid = SpatialGrid()
@@ -0,0 +1,151 @@
+"""Rolling timings and counters for the phases of the game loop."""
+
+import math as _math
+
+
+class _RollingWindow:  # pylint: disable=too-few-public-methods
+    """A fixed-size ring of the most recent samples."""
+
+    def __init__(self, size):
+        self.samples = [0.0] * size
+        self.index = 0
+        self.filled = 0
+
+    def add(self, value):
+        """Add a sample, overwriting the oldest one once the window is full.
+        :param value: The sample to add."""
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % len(self.samples)
+        if self.filled < len(self.samples):
+            self.filled += 1
+
+    def values(self):
+        """Get the samples currently in the window.
+        :return: A list of samples, oldest first."""
+        if self.filled < len(self.samples):
+            return self.samples[: self.filled]
+        return self.samples[self.index :] + self.samples[: self.index]
+
+
+class FrameStats:
+    """
+    Timings of every phase of the game loop over the last frames, and counters
+    of the work done in the last frame. Recording a sample is a couple of list
+    writes, so this can stay enabled in a finished game.
+
+    Example:
+
+        @play.repeat_forever
+        def show_stats():
+            print(play.stats.percentiles("physics"), play.stats.counts)
+    """
+
+    COUNTERS = (
+        "sprites_updated",
+        "sprites_rerendered",
+        "sprites_drawn",
+        "sprites_culled",
+        "batch_sprites_drawn",
+        "particles_live",
+        "surfaces_allocated",
+        "masks_built",
+        "surface_cache_hits",
+        "surface_cache_misses",
+        "physics_bodies",
+        "physics_steps",
+        "timers_pending",
+    )
+
+    def __init__(self, window=300):
+        self.enabled = True
+        self._window = window
+        self._timings = {}
+        self._current_counts = dict.fromkeys(self.COUNTERS, 0)
+        self.counts = dict.fromkeys(self.COUNTERS, 0)
+
+    def record(self, phase, seconds):
+        """Record how long a phase of the game loop took.
+        :param phase: The name of the phase.
+        :param seconds: The time the phase took, in seconds."""
+        window = self._timings.get(phase)
+        if window is None:
+            window = self._timings[phase] = _RollingWindow(self._window)
+        window.add(seconds)
+
+    def count(self, counter, amount=1):
+        """Add to one of the counters of the current frame.
+        :param counter: The name of the counter.
+        :param amount: How much to add."""
+        if self.enabled:
+            self._current_counts[counter] = (
+                self._current_counts.get(counter, 0) + amount
+            )
+
+    def set_count(self, counter, value):
+        """Set one of the counters of the current frame.
+        :param counter: The name of the counter.
+        :param value: The new value."""
+        if self.enabled:
+            self._current_counts[counter] = value
+
+    def end_frame(self):
+        """Publish the counters of the frame that just ended and start counting again.
+        The counters are copied, so a frame's counts don't change after it ended."""
+        self.counts = dict(self._current_counts)
+        for counter in self._current_counts:
+            self._current_counts[counter] = 0
+
+    @property
+    def phases(self):
+        """Get the names of the phases that have been timed.
+        :return: A list of phase names, in the order they were first recorded."""
+        return list(self._timings)
+
+    def percentile(self, phase, percent):
+        """Get a percentile of the recent timings of a phase.
+        :param phase: The name of the phase, for example "physics" or "frame".
+        :param percent: The percentile, between 0 and 100.
+        :return: The timing in milliseconds, or None if the phase wasn't timed yet."""
+        window = self._timings.get(phase)
+        if window is None or window.filled == 0:
+            return None
+        values = sorted(window.values())
+        index = _math.ceil(percent / 100 * len(values)) - 1
+        return values[min(max(index, 0), len(values) - 1)] * 1000
+
+    def percentiles(self, phase):
+        """Get the p50, p95 and p99 timings of a phase.
+        :param phase: The name of the phase.
+        :return: A dictionary with the timings in milliseconds."""
+        return {
+            "p50": self.percentile(phase, 50),
+            "p95": self.percentile(phase, 95),
+            "p99": self.percentile(phase, 99),
+        }
+
+    def mean(self, phase):
+        """Get the average recent timing of a phase.
+        :param phase: The name of the phase.
+        :return: The average in milliseconds, or None if the phase wasn't timed yet."""
+        window = self._timings.get(phase)
+        if window is None or window.filled == 0:
+            return None
+        values = window.values()
+        return sum(values) / len(values) * 1000
+
+    def summary(self):
+        """Get the percentiles of every timed phase.
+        :return: A dictionary from phase name to its percentiles."""
+        return {phase: self.percentiles(phase) for phase in self._timings}
+
+    def reset(self, window=None):
+        """Forget all timings and counters.
+        :param window: The number of frames to keep timings for, unchanged if None."""
+        if window is not None:
+            self._window = window
+        self._timings.clear()
+        self._current_counts = dict.fromkeys(self.COUNTERS, 0)
+        self.counts = dict.fromkeys(self.COUNTERS, 0)
+
+
+stats = FrameStats()
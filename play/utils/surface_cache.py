@@ -0,0 +1,126 @@
+"""A cache of rendered surfaces, shared by sprites that look the same."""
+
+from collections import OrderedDict
+
+import pygame
+
+from .stats import stats
+
+
+def _surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """
+    Sprites that look the same share the same rendered surface. A thousand red
+    circles with a radius of 10 are drawn once. The least recently used surfaces
+    are dropped once the cache holds more than max_bytes of pixels.
+
+    Surfaces in the cache are shared, so they must never be drawn on. Copy a
+    surface before changing it.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, angle_step=1):
+        self.enabled = True
+        self.max_bytes = max_bytes
+        self.angle_step = angle_step
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+
+    def get(self, key, render):
+        """Get a rendered surface, rendering it if it isn't in the cache yet.
+        :param key: A tuple of everything that changes how the surface looks.
+        :param render: A function without arguments that renders the surface.
+        :return: The rendered surface, possibly shared with other sprites."""
+        if not self.enabled:
+            return render()
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            stats.count("surface_cache_hits")
+            return surface
+
+        surface = render()
+        self.misses += 1
+        stats.count("surface_cache_misses")
+        self._surfaces[key] = surface
+        self.bytes += _surface_bytes(surface)
+        self._evict()
+        return surface
+
+    def quantize_angle(self, angle):
+        """Round an angle to the angle step of the cache, so sprites at almost the
+        same angle share their turned surface.
+        :param angle: The angle in degrees.
+        :return: The rounded angle, between 0 and 360."""
+        return round(angle / self.angle_step) * self.angle_step % 360
+
+    def rotate(self, key, surface, angle):
+        """Turn a cached surface, sharing the result with every sprite that turns the
+        same surface to the same rounded angle. The turned surface is found by the
+        key of the surface, so it doesn't keep the surface alive once it's dropped.
+        :param key: The key the surface was cached with.
+        :param surface: The surface from the cache.
+        :param angle: The angle in degrees.
+        :return: The turned surface."""
+        angle = self.quantize_angle(angle)
+
+        def render():
+            stats.count("surfaces_allocated")
+            return pygame.transform.rotate(surface, angle)
+
+        return self.get(("rotate", key, angle), render)
+
+    def set_max_bytes(self, max_bytes):
+        """Change how many bytes of pixels the cache may hold.
+        :param max_bytes: The new limit, surfaces are dropped right away if it's lower.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes can't be negative.")
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self._surfaces:
+            _, surface = self._surfaces.popitem(last=False)
+            self.bytes -= _surface_bytes(surface)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self):
+        """Get the share of lookups that found a surface in the cache.
+        :return: A number between 0 and 1."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self):
+        """Get the statistics of the cache.
+        :return: A dictionary with the hits, misses, hit rate, bytes, entries and evictions.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "bytes": self.bytes,
+            "entries": len(self._surfaces),
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        """Drop every surface and reset the statistics."""
+        self._surfaces.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+surface_cache = SurfaceCache()
+# turned variants of image sprites, kept apart so spinning images don't push the
+# drawings of other sprites out of the cache
+rotation_cache = SurfaceCache(max_bytes=32 * 1024 * 1024)
@@ -0,0 +1,48 @@
+"""Tests for play.animate() waiting for rendered frames."""
+
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_animate_resumes_once_per_frame():
+    """A loop around play.animate() runs exactly once per frame."""
+    import play
+
+    seen = []
+
+    @play.when_program_starts
+    async def count():
+        while True:
+            seen.append(play.frame_count())
+            await play.animate()
+
+    play.step_frames(10)
+
+    assert seen == list(range(0, 11))
+
+
+def test_animate_multiple_frames():
+    """play.animate(frames=n) waits for n frames."""
+    import play
+
+    seen = []
+
+    @play.when_program_starts
+    async def count():
+        while True:
+            seen.append(play.frame_count())
+            await play.animate(frames=3)
+
+    play.step_frames(9)
+
+    assert seen == [0, 3, 6, 9]
+
+
+def test_animate_waiters_share_a_future():
+    """Coroutines waiting for the same frame don't each get their own future."""
+    from play.core.frame_driver import frame_driver
+
+    assert frame_driver.next_frame() is frame_driver.next_frame()
@@ -0,0 +1,121 @@
+"""Tests for the frame-clock timer wheel behind play.timer, play.every and play.after."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_timers_fire_in_order():
+    """Timers fire when the frame clock passes their deadline."""
+    from play.core.timer_wheel import TimerWheel
+
+    wheel = TimerWheel()
+    fired = []
+    for delay in (0.5, 0.01, 5.0, 100.0, 0.2):
+        wheel.schedule(delay, fired.append, delay)
+
+    assert wheel.pending == 5
+    wheel.advance(0.3)
+    assert fired == [0.01, 0.2]
+    wheel.advance(10)
+    assert fired == [0.01, 0.2, 0.5, 5.0]
+    wheel.advance(100)
+    assert fired == [0.01, 0.2, 0.5, 5.0, 100.0]
+    assert wheel.pending == 0
+
+
+def test_timers_across_levels_fire_on_time():
+    """Timers that start in higher levels fire on the right tick."""
+    from play.core.timer_wheel import TimerWheel
+
+    wheel = TimerWheel(resolution=1, levels=2)
+    fired = []
+    for delay in (63, 64, 65, 4095, 4096, 5000, 300000):
+        wheel.schedule(delay, lambda d=delay: fired.append((d, wheel._tick)))
+
+    for _ in range(300001):
+        wheel.advance(1)
+
+    assert fired == [(d, d) for d in (63, 64, 65, 4095, 4096, 5000, 300000)]
+
+
+def test_cancelled_timers_dont_fire():
+    """A cancelled timer is no longer pending and never fires."""
+    from play.core.timer_wheel import TimerWheel
+
+    wheel = TimerWheel()
+    fired = []
+    handle = wheel.schedule(1, fired.append, "cancelled")
+    wheel.schedule(1, fired.append, "kept")
+    wheel.cancel(handle)
+
+    assert wheel.pending == 1
+    wheel.advance(2)
+    assert fired == ["kept"]
+
+
+def test_play_timer_counts_frame_time():
+    """play.timer ends after its number of seconds of frame time."""
+    import play
+
+    done_at = []
+
+    @play.when_program_starts
+    async def wait():
+        await play.timer(seconds=0.5)
+        done_at.append(play.frame_count())
+
+    play.step_frames(40)
+
+    assert done_at == [30]
+
+
+def test_every_and_after():
+    """@play.every repeats without drifting and @play.after fires once."""
+    import play
+
+    every_frames = []
+    after_frames = []
+
+    @play.every(0.25)
+    def repeat():
+        every_frames.append(play.frame_count())
+
+    @play.after(0.5)
+    def once():
+        after_frames.append(play.frame_count())
+
+    play.step_frames(61)
+
+    assert every_frames == [15, 30, 45, 60]
+    assert after_frames == [30]
+
+
+def test_every_skips_times_while_running():
+    """@play.every doesn't start again while its last call is still running."""
+    import play
+
+    running = []
+    most_running = []
+
+    @play.every(0.004)
+    async def slow():
+        running.append(True)
+        most_running.append(len(running))
+        await play.animate(frames=3)
+        running.pop()
+
+    play.step_frames(10)
+
+    assert most_running
+    assert max(most_running) == 1
+
+
+def test_every_rejects_bad_interval():
+    import play
+
+    with pytest.raises(ValueError):
+        play.every(0)
@@ -0,0 +1,85 @@
+"""Tests for finding the sprites under the mouse pointer when clicking."""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def _click(play, x, y):
+    import pygame
+
+    position = play.screen.width / 2 + x, play.screen.height / 2 - y
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=position))
+    pygame.event.post(
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=position, button=1)
+    )
+    play.step_frames(1)
+
+
+def _record_clicks(*sprites):
+    clicks = []
+
+    def recorder(sprite):
+        def clicked():
+            clicks.append(sprite)
+
+        return clicked
+
+    for sprite in sprites:
+        sprite.when_clicked(recorder(sprite))
+    return clicks
+
+
+def test_click_goes_to_every_sprite_under_the_mouse():
+    import play
+
+    bottom = play.new_box(x=0, y=0, width=100, height=100)
+    top = play.new_box(x=10, y=0, width=50, height=50)
+    far = play.new_box(x=300, y=200, width=50, height=50)
+    clicks = _record_clicks(bottom, top, far)
+
+    _click(play, 5, 0)
+    assert clicks == [bottom, top]
+    assert bottom.is_clicked and top.is_clicked and not far.is_clicked
+
+
+def test_topmost_click_mode_only_clicks_the_sprite_on_top():
+    import play
+
+    bottom = play.new_box(x=0, y=0, width=100, height=100)
+    top = play.new_box(x=10, y=0, width=50, height=50)
+    hidden = play.new_box(x=0, y=0, width=50, height=50)
+    hidden.hide()
+    clicks = _record_clicks(bottom, top, hidden)
+
+    play.set_click_mode("topmost")
+    try:
+        _click(play, 5, 0)
+        assert clicks == [top]
+
+        _click(play, -40, 0)
+        assert clicks == [top, bottom]
+    finally:
+        play.set_click_mode("all")
+
+
+def test_is_clicked_resets_in_the_next_frame():
+    import play
+
+    box = play.new_box(x=0, y=0, width=50, height=50)
+    _click(play, 0, 0)
+    assert box.is_clicked
+
+    play.step_frames(1)
+    assert not box.is_clicked
+
+
+def test_unknown_click_mode():
+    import play
+
+    with pytest.raises(ValueError, match="topmost"):
+        play.set_click_mode("bottom")
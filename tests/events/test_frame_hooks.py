@@ -0,0 +1,62 @@
+"""Tests for the frame driver, its frame counter and frame hooks."""
+
+import pytest
+import sys
+
+sys.path.insert(0, ".")
+
+max_frames = 20
+
+
+def test_frame_hooks_and_counter():
+    """Frame hooks run once per frame, around the repeat_forever callbacks."""
+    import play
+
+    calls = []
+    counts = []
+
+    @play.before_each_frame
+    def before():
+        calls.append("before")
+
+    @play.after_each_frame
+    def after():
+        calls.append("after")
+        counts.append(play.frame_count())
+        if play.frame_count() == max_frames:
+            play.stop_program()
+
+    play.start_program()
+
+    assert counts == list(range(1, max_frames + 1))
+    assert calls[:4] == ["before", "after", "before", "after"]
+
+
+def test_single_game_loop_task():
+    """The game loop runs as one task instead of a new task per frame."""
+    import asyncio
+    import play
+    from play.loop import loop
+
+    task_ids = set()
+
+    @play.after_each_frame
+    def record():
+        task_ids.add(id(asyncio.current_task(loop)))
+        if play.frame_count() == max_frames:
+            play.stop_program()
+
+    play.start_program()
+
+    assert len(task_ids) == 1
+
+
+def test_async_frame_hook_rejected():
+    """Frame hooks can't be async functions."""
+    import play
+
+    with pytest.raises(ValueError):
+
+        @play.before_each_frame
+        async def hook():
+            pass
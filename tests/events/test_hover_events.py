@@ -0,0 +1,82 @@
+"""Tests for the mouse over and mouse leave events of sprites."""
+
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def _move_mouse(play, x, y):
+    import pygame
+
+    position = play.screen.width / 2 + x, play.screen.height / 2 - y
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=position))
+    play.step_frames(1)
+
+
+def test_mouse_over_and_leave_run_once():
+    import play
+
+    button = play.new_box(x=0, y=0, width=100, height=50)
+    events = []
+
+    @button.when_mouse_over
+    def over():
+        events.append("over")
+
+    @button.when_mouse_leave
+    def leave():
+        events.append("leave")
+
+    play.step_frames(1)
+    _move_mouse(play, 300, 200)
+    assert not events
+
+    _move_mouse(play, 10, 0)
+    _move_mouse(play, 20, 5)
+    play.step_frames(1)
+    assert events == ["over"]
+
+    _move_mouse(play, 300, 200)
+    assert events == ["over", "leave"]
+
+
+def test_hover_events_get_the_sprite():
+    import play
+
+    bottom = play.new_box(x=0, y=0, width=100, height=100)
+    top = play.new_circle(x=0, y=0, radius=20)
+    hovered = []
+
+    def over(sprite):
+        hovered.append(sprite)
+
+    bottom.when_mouse_over(over, call_with_sprite=True)
+    top.when_mouse_over(over, call_with_sprite=True)
+
+    play.step_frames(1)
+    _move_mouse(play, 40, 0)
+    assert hovered == [bottom]
+
+    _move_mouse(play, 0, 0)
+    assert hovered == [bottom, top]
+
+
+def test_only_sprites_with_hover_events_are_kept():
+    import play
+    from play.core.mouse_loop import mouse_state
+
+    button = play.new_box(x=0, y=0, width=100, height=50)
+    play.new_box(x=0, y=0, width=100, height=50)
+    left = []
+    button.when_mouse_leave(lambda: left.append(button))
+
+    play.step_frames(1)
+    _move_mouse(play, 0, 0)
+    assert mouse_state.hovered_sprites == {button}
+
+    button.remove()
+    _move_mouse(play, 300, 200)
+    assert not mouse_state.hovered_sprites
+    assert not left
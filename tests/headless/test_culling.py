@@ -0,0 +1,112 @@
+"""Tests for skipping the sprites outside the screen with play.set_culling()."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def _pixel(x, y):
+    import play
+
+    return tuple(play.globals.globals_list.display.get_at((x, y)))[:3]
+
+
+def _is_red(color):
+    return color[0] == 255 and color[1] < 5 and color[2] < 5
+
+
+def test_culling_counts_drawn_and_culled_sprites():
+    import play
+
+    play.set_culling()
+    play.new_box(x=0, y=0, width=20, height=20)
+    play.new_circle(x=100, y=50, radius=10)
+    play.new_box(x=5000, y=0, width=20, height=20)
+    play.step_frames(1)
+
+    assert play.stats.counts["sprites_drawn"] == 2
+    assert play.stats.counts["sprites_culled"] == 1
+
+
+def test_sprites_are_counted_as_drawn_without_culling():
+    import play
+
+    play.new_box(x=0, y=0)
+    play.new_box(x=5000, y=0)
+    play.step_frames(1)
+
+    assert play.stats.counts["sprites_drawn"] == 2
+    assert play.stats.counts["sprites_culled"] == 0
+
+
+def test_off_screen_sprite_draws_its_image_when_it_comes_back():
+    import play
+
+    play.set_culling()
+    box = play.new_box(color="black", x=5000, y=0, width=20, height=20)
+    play.step_frames(1)
+
+    box.color = "red"
+    play.step_frames(1)
+    assert play.stats.counts["sprites_rerendered"] == 0
+    assert box._should_recompute
+
+    box.x = 0
+    play.step_frames(1)
+    assert play.stats.counts["sprites_rerendered"] == 1
+    assert not box._should_recompute
+    assert _is_red(_pixel(400, 300))
+
+
+def test_off_screen_sprite_is_updated_once_per_frame():
+    import play
+
+    play.set_culling()
+    box = play.new_box(color="black", x=5000, y=0, width=20, height=20)
+    play.step_frames(1)
+    box.color = "red"
+
+    updates = []
+    update = box.update
+    box.update = lambda: updates.append(play.frame_count()) or update()
+    play.step_frames(3)
+
+    assert updates == [1, 2, 3]
+    assert box._should_recompute
+
+
+def test_margin_keeps_sprites_near_the_edge():
+    import play
+
+    play.set_culling(margin=100)
+    play.new_box(x=460, y=0, width=20, height=20)
+    play.step_frames(1)
+
+    assert play.stats.counts["sprites_drawn"] == 1
+    assert play.stats.counts["sprites_culled"] == 0
+
+
+def test_dirty_renderer_skips_culled_sprites():
+    import play
+
+    play.set_renderer("dirty")
+    play.set_culling()
+    near = play.new_box(x=0, y=0)
+    far = play.new_box(x=5000, y=0)
+    play.step_frames(1)
+    assert near.visible and not far.visible
+
+    play.set_culling(False)
+    play.step_frames(1)
+    assert far.visible
+    assert play.stats.counts["sprites_culled"] == 0
+
+
+def test_culling_margin_cant_be_negative():
+    import play
+
+    with pytest.raises(ValueError):
+        play.set_culling(margin=-1)
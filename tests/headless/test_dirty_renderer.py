@@ -0,0 +1,79 @@
+"""Tests for the renderer that only draws the parts of the screen that changed."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+MARKER = (1, 2, 3)
+
+
+def _pixel(x, y):
+    import play
+
+    return tuple(play.globals.globals_list.display.get_at((x, y)))[:3]
+
+
+def _is_red(color):
+    return color[0] == 255 and color[1] < 5 and color[2] < 5
+
+
+def test_dirty_renderer_draws_sprites():
+    import play
+
+    play.set_renderer("dirty")
+    play.set_backdrop("light blue")
+    play.new_box(color="red", x=0, y=0, width=20, height=20)
+    play.step_frames(1)
+
+    assert _is_red(_pixel(400, 300))
+    assert _pixel(10, 10) == (173, 216, 230)
+
+
+def test_dirty_renderer_only_redraws_moved_sprites():
+    import play
+
+    play.set_renderer("dirty")
+    box = play.new_box(color="red", x=0, y=0, width=20, height=20)
+    play.step_frames(1)
+
+    play.globals.globals_list.display.fill(MARKER)
+    box.x += 100
+    play.step_frames(1)
+
+    # the old and the new place of the box were drawn, the rest of the screen wasn't
+    assert _pixel(400, 300) == (255, 255, 255)
+    assert _is_red(_pixel(500, 300))
+    assert _pixel(10, 10) == MARKER
+
+
+def test_dirty_renderer_keeps_sprites():
+    import play
+
+    box = play.new_box()
+    play.set_renderer("dirty")
+    assert box in play.globals.globals_list.sprites_group
+    play.set_renderer("full")
+    assert box in play.globals.globals_list.sprites_group
+    assert len(play.globals.globals_list.sprites_group) == 1
+
+
+def test_dirty_renderer_removes_sprites():
+    import play
+
+    play.set_renderer("dirty")
+    box = play.new_box(color="red", x=0, y=0, width=20, height=20)
+    play.step_frames(1)
+    box.remove()
+    play.step_frames(1)
+
+    assert _pixel(400, 300) == (255, 255, 255)
+
+
+def test_unknown_renderer():
+    import play
+
+    with pytest.raises(ValueError):
+        play.set_renderer("fast")
@@ -0,0 +1,144 @@
+"""Tests for saving power while the window is unfocused or hidden."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def _post(event_type):
+    import pygame
+
+    pygame.event.post(pygame.event.Event(event_type))
+
+
+def test_power_saving_is_off_by_default():
+    """Without power saving, hiding the window changes nothing."""
+    import play
+    import pygame
+    from play.core.window_loop import window_state
+
+    _post(pygame.WINDOWMINIMIZED)
+    play.step_frames(1)
+
+    assert not window_state.visible
+    assert window_state.should_render
+    assert window_state.frame_rate == 60
+
+
+def test_unfocused_window_is_throttled():
+    """An unfocused window runs at the idle frame rate but keeps drawing."""
+    import play
+    import pygame
+    from play.core.window_loop import window_state
+
+    play.set_power_saving(idle_frame_rate=10)
+    _post(pygame.WINDOWFOCUSLOST)
+    play.step_frames(1)
+
+    assert window_state.idle
+    assert window_state.frame_rate == 10
+    assert window_state.should_render
+
+    _post(pygame.WINDOWFOCUSGAINED)
+    play.step_frames(1)
+    assert not window_state.idle
+    assert window_state.frame_rate == 60
+
+
+def test_hidden_window_is_not_drawn():
+    """Nothing is drawn while the window is minimized, physics keeps running."""
+    import play
+    import pygame
+    from play.core.window_loop import window_state
+
+    play.set_power_saving()
+    ball = play.new_circle(radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+    play.step_frames(1)
+
+    _post(pygame.WINDOWMINIMIZED)
+    play.step_frames(1)
+    display = play.globals.globals_list.display
+    display.fill((1, 2, 3))
+    play.step_frames(58)
+
+    assert not window_state.should_render
+    assert round(ball.x) == 60
+    # neither the backdrop nor the sprite were drawn over the marker color
+    assert tuple(display.get_at((400, 300)))[:3] == (1, 2, 3)
+
+    _post(pygame.WINDOWRESTORED)
+    play.step_frames(1)
+    assert window_state.should_render
+
+
+def test_pause_when_idle():
+    """Physics and timers stand still while the window is idle, if the policy says so."""
+    import play
+    import pygame
+
+    play.set_power_saving(pause_when_idle=True)
+    ball = play.new_circle(radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+    fired = []
+
+    @play.after(0.5)
+    def fire():
+        fired.append(True)
+
+    _post(pygame.WINDOWFOCUSLOST)
+    play.step_frames(60)
+    assert round(ball.x) == 0
+    assert not fired
+
+    _post(pygame.WINDOWFOCUSGAINED)
+    play.step_frames(60)
+    assert round(ball.x) == 60
+    assert fired
+
+
+def test_idle_physics_keeps_real_time():
+    """Physics keeps up with the clock while the game loop runs at the idle frame rate."""
+    import play
+    import pygame
+    from time import perf_counter
+    from play.core import game_loop
+    from play.core.frame_driver import frame_driver
+    from play.loop import loop
+
+    play.set_power_saving(idle_frame_rate=10)
+    ball = play.new_circle(radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+    fired = []
+
+    @play.after(0.5)
+    def fire():
+        fired.append(True)
+
+    _post(pygame.WINDOWFOCUSLOST)
+    start = perf_counter()
+
+    def stop_after_a_second():
+        if perf_counter() - start >= 1:
+            frame_driver.running = False
+
+    frame_driver.add_hook("after_frame", stop_after_a_second)
+    loop.run_until_complete(game_loop())
+    frame_driver.remove_hook("after_frame", stop_after_a_second)
+    elapsed = perf_counter() - start
+
+    assert fired
+    assert ball.x == pytest.approx(60 * elapsed, abs=15)
+
+    _post(pygame.WINDOWFOCUSGAINED)
+    play.step_frames(1)
+
+
+def test_set_power_saving_rejects_bad_rate():
+    import play
+
+    with pytest.raises(ValueError):
+        play.set_power_saving(idle_frame_rate=0)
@@ -0,0 +1,129 @@
+"""Tests for skipping the drawing of frames where nothing changed."""
+
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+MARKER = (1, 2, 3)
+
+
+def _mark_screen():
+    """Paint the screen, so we can see if the next frame draws over it."""
+    import play
+
+    play.globals.globals_list.display.fill(MARKER)
+
+
+def _screen_was_drawn():
+    import play
+
+    return tuple(play.globals.globals_list.display.get_at((0, 0)))[:3] != MARKER
+
+
+def test_unchanged_frames_are_not_drawn():
+    import play
+
+    play.new_box(x=0, y=0)
+    play.step_frames(1)
+
+    _mark_screen()
+    play.step_frames(5)
+    assert not _screen_was_drawn()
+
+
+def test_changed_sprite_is_drawn():
+    import play
+
+    box = play.new_box(x=0, y=0)
+    play.step_frames(1)
+
+    _mark_screen()
+    box.x += 10
+    play.step_frames(1)
+    assert _screen_was_drawn()
+
+
+def test_backdrop_change_is_drawn():
+    import play
+
+    play.step_frames(1)
+
+    _mark_screen()
+    play.set_backdrop("light blue")
+    play.step_frames(1)
+    assert _screen_was_drawn()
+
+
+def test_removed_sprite_is_drawn():
+    import play
+
+    box = play.new_box(x=0, y=0)
+    play.step_frames(1)
+
+    _mark_screen()
+    box.remove()
+    play.step_frames(1)
+    assert _screen_was_drawn()
+
+
+def test_moving_body_is_drawn():
+    import play
+
+    ball = play.new_circle(radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+    play.step_frames(1)
+
+    _mark_screen()
+    play.step_frames(1)
+    assert _screen_was_drawn()
+    ball.remove()
+
+
+def test_new_sprite_in_idle_scene_is_drawn():
+    import play
+
+    play.step_frames(3)
+
+    _mark_screen()
+    play.new_box(color="red", x=0, y=0)
+    play.step_frames(1)
+    assert _screen_was_drawn()
+
+
+def test_one_change_draws_one_frame():
+    """A change made by a sprite event is drawn in its own frame only."""
+    import play
+    from play.core.renderer import renderer
+
+    box = play.new_box(x=0, y=0, width=20, height=20)
+    other = play.new_box(x=300, y=0, width=20, height=20)
+
+    @box.when_touching(other)
+    def turn_red():
+        box.color = "red"
+
+    play.step_frames(3)
+
+    flips = []
+    present = renderer.present
+    renderer.present = lambda: flips.append(play.frame_count()) or present()
+    box.x = 290
+    play.step_frames(5)
+    renderer.present = present
+
+    assert flips == [3]
+    assert box.color == "red"
+
+
+def test_every_frame_is_drawn_when_disabled():
+    import play
+    from play.utils.scene import scene
+
+    scene.enabled = False
+    play.step_frames(1)
+
+    _mark_screen()
+    play.step_frames(1)
+    assert _screen_was_drawn()
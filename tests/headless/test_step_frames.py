@@ -0,0 +1,72 @@
+"""Tests for running the game loop headless with play.step_frames()."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_step_frames_moves_physics():
+    """Each stepped frame advances physics by one frame, without real-time waiting."""
+    import play
+
+    ball = play.new_circle(radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+
+    assert play.step_frames(100) == 100
+    assert round(ball.x) == 100
+    assert play.frame_count() == 100
+
+
+def test_step_frames_with_dt():
+    """A custom dt changes how far the simulation advances per frame."""
+    import play
+
+    ball = play.new_circle(radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+
+    play.step_frames(10, dt=0.1)
+    assert abs(ball.x - 60) < 0.5
+
+
+def test_step_frames_runs_callbacks():
+    """Program start and repeat_forever callbacks run while stepping."""
+    import play
+
+    started = []
+    frames = []
+
+    @play.when_program_starts
+    def start():
+        started.append(True)
+
+    @play.repeat_forever
+    def loop():
+        frames.append(play.frame_count())
+
+    play.step_frames(5)
+    play.step_frames(5)
+
+    assert started == [True]
+    assert len(frames) == 10
+
+
+def test_step_frames_stop_program():
+    """Stopping the program ends stepping early."""
+    import play
+
+    @play.repeat_forever
+    def loop():
+        if play.frame_count() == 3:
+            play.stop_program()
+
+    assert play.step_frames(10) == 3
+
+
+def test_headless_uses_dummy_driver():
+    """PLAY_HEADLESS selects SDL's dummy video driver."""
+    import play
+
+    assert play.pygame.display.get_driver() in ("dummy", "offscreen")
@@ -0,0 +1,54 @@
+"""Tests for loading image files once and sharing them between sprites."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+IMAGE = "tests/objects_attributes/yellow.jpg"
+
+
+def test_image_file_is_loaded_once():
+    import play
+
+    play.image_assets.clear()
+    images = [play.new_image(IMAGE, size=10) for _ in range(20)]
+
+    assert all(image._source_image is images[0]._source_image for image in images)
+    assert play.image_assets.info()["misses"] == 1
+    assert play.image_assets.info()["hits"] == 19
+    assert play.image_assets.info()["bytes"] > 0
+
+
+def test_loaded_image_is_converted_to_the_screen_format():
+    import play
+
+    surface = play.image_assets.load(IMAGE)
+    display = play.globals.globals_list.display
+
+    assert surface.get_bitsize() == display.get_bitsize()
+
+
+def test_preload_images():
+    import play
+
+    play.image_assets.clear()
+    play.preload_images([IMAGE])
+    play.new_image(IMAGE)
+    play.set_backdrop_image(IMAGE)
+
+    assert play.image_assets.info() == {
+        "hits": 2,
+        "misses": 1,
+        "bytes": play.image_assets.bytes,
+        "images": 1,
+    }
+
+
+def test_missing_image_file():
+    import play
+
+    with pytest.raises(FileNotFoundError):
+        play.preload_images(["does/not/exist.png"])
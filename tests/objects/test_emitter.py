@@ -0,0 +1,97 @@
+"""Tests for particle emitters."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_emitter_sends_out_particles():
+    import play
+
+    emitter = play.new_emitter(rate=60, lifetime=1)
+    play.step_frames(30)
+
+    assert emitter.live_count == 30
+    assert play.stats.counts["particles_live"] == 30
+
+
+def test_particles_die():
+    import play
+
+    emitter = play.new_emitter(rate=60, lifetime=0.5)
+    play.step_frames(60)
+
+    # a particle lives for 30 frames
+    assert emitter.live_count == 30
+
+    emitter.emitting = False
+    play.step_frames(30)
+    assert emitter.live_count == 0
+
+
+def test_emitter_is_capped():
+    import play
+
+    emitter = play.new_emitter(rate=600, lifetime=10, max_particles=50)
+    play.step_frames(30)
+
+    assert emitter.live_count == 50
+
+
+def test_particles_move_and_fall():
+    import play
+
+    emitter = play.new_emitter(
+        rate=0, speed=60, direction=0, spread=0, gravity=120, lifetime=5
+    )
+    emitter.burst(1)
+    play.step_frames(60)
+
+    assert emitter._x[0] == pytest.approx(60)
+    assert emitter._y[0] == pytest.approx(-60, abs=2)
+
+
+def test_particles_are_drawn():
+    import play
+
+    emitter = play.new_emitter(
+        rate=0, speed=0, color="red", end_color="blue", radius=5, lifetime=1
+    )
+    emitter.burst(1)
+    play.step_frames(1)
+    assert tuple(play.globals.globals_list.display.get_at((400, 300)))[:3] != (
+        255,
+        255,
+        255,
+    )
+
+    emitter.remove()
+    play.step_frames(1)
+    assert tuple(play.globals.globals_list.display.get_at((400, 300)))[:3] == (
+        255,
+        255,
+        255,
+    )
+
+
+def test_particles_share_life_surfaces():
+    import play
+
+    play.surface_cache.clear()
+    play.new_emitter(rate=6000, lifetime=1, color="red", end_color="yellow")
+    play.step_frames(90)
+
+    # one surface per step of life, no matter how many particles
+    assert play.surface_cache.misses <= 16
+
+
+def test_emitter_arguments():
+    import play
+
+    with pytest.raises(ValueError):
+        play.new_emitter(max_particles=0)
+    with pytest.raises(ValueError):
+        play.new_emitter(lifetime=0)
@@ -0,0 +1,85 @@
+"""Tests for groups of sprites and touching events of whole groups."""
+
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_group_adds_and_removes_sprites():
+    import play
+
+    a = play.new_box()
+    b = play.new_circle()
+    group = play.new_group(a)
+    group.add(b, b)
+
+    assert len(group) == 2
+    assert list(group) == [a, b]
+    assert b in group
+
+    group.remove(a)
+    assert a not in group and a in play.globals.globals_list.sprites_group
+
+    b.remove()
+    assert len(group) == 0
+
+
+def test_when_touching_group_gets_the_touched_sprite():
+    import play
+
+    player = play.new_box(x=0, y=0, width=20, height=20)
+    coins = play.new_group(
+        *[play.new_circle(x=x, y=200, radius=5) for x in range(-300, 300, 50)]
+    )
+    near = play.new_circle(x=5, y=0, radius=5)
+    collected = []
+
+    @player.when_touching(coins)
+    def collect(coin):
+        collected.append(coin)
+        coin.remove()
+
+    play.step_frames(1)
+    assert not collected
+
+    # sprites that join the group later are picked up
+    coins.add(near)
+    play.step_frames(2)
+    assert collected == [near]
+    assert near not in coins
+
+
+def test_when_touching_group_without_arguments():
+    import play
+
+    player = play.new_box(x=0, y=0, width=20, height=20)
+    enemies = play.new_group(play.new_box(x=0, y=0), play.new_box(x=10, y=0))
+    touches = []
+
+    @player.when_touching(enemies)
+    def hit():
+        touches.append(play.frame_count())
+
+    play.step_frames(1)
+    assert touches == [0, 0]
+
+
+def test_when_stopped_touching_group():
+    import play
+
+    player = play.new_box(x=0, y=0, width=20, height=20)
+    wall = play.new_box(x=0, y=0, width=20, height=20)
+    walls = play.new_group(wall, play.new_box(x=300, y=0))
+    stopped = []
+
+    @player.when_stopped_touching(walls)
+    def left(sprite):
+        stopped.append(sprite)
+
+    play.step_frames(1)
+    player.x = -200
+    play.step_frames(2)
+
+    assert stopped == [wall]
@@ -0,0 +1,75 @@
+"""Tests for caching the turned copies of image sprites."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+IMAGE = "tests/objects_attributes/yellow.jpg"
+
+
+def test_turned_images_are_reused():
+    import play
+    from play.utils.surface_cache import rotation_cache
+
+    rotation_cache.clear()
+    coin = play.new_image(IMAGE, size=2)
+    coin.cache_rotations(angle_step=10)
+    coin.update()
+
+    images = []
+    for _ in range(72):
+        coin.turn(10)
+        coin.update()
+        images.append(coin.image)
+
+    # 36 different angles, each turned only once
+    assert rotation_cache.misses == 36
+    assert images[0] is images[36]
+
+
+def test_angle_is_rounded_to_the_step():
+    """Images of the same surface share turned copies at the same rounded angle."""
+    import play
+    import pygame
+
+    surface = pygame.image.load(IMAGE)
+    first = play.new_image(surface, size=2, angle=41)
+    second = play.new_image(surface, size=2, angle=39)
+    first.cache_rotations(angle_step=5)
+    second.cache_rotations(angle_step=5)
+    first.update()
+    second.update()
+
+    assert first.image is second.image
+
+
+def test_rotations_are_built_in_the_background():
+    import play
+    from play.utils.surface_cache import rotation_cache
+
+    rotation_cache.clear()
+    coin = play.new_image(IMAGE, size=2)
+    coin.cache_rotations(angle_step=30, in_background=True)
+    play.step_frames(15)
+
+    assert rotation_cache.info()["entries"] == 12
+
+
+def test_cache_rotations_can_be_turned_off():
+    import play
+
+    coin = play.new_image(IMAGE, size=2)
+    coin.cache_rotations(angle_step=10)
+    coin.cache_rotations(angle_step=None)
+    coin.angle = 3
+    coin.update()
+    other = play.new_image(IMAGE, size=2, angle=3)
+
+    assert coin.image is not other.image
+    assert coin.image.get_size() == other.image.get_size()
+
+    with pytest.raises(ValueError):
+        coin.cache_rotations(angle_step=0)
@@ -200,3 +200,34 @@ def test_line_size_property():
 
     line.size = 200
     assert line.size == 200
+
+
+def test_line_rect_is_its_extent():
+    """The rect of a line only covers the line, not the whole screen."""
+    import play
+
+    line = play.new_line(x=0, y=0, x1=100, y1=50, thickness=4)
+
+    assert line.rect.width < 120
+    assert line.rect.height < 70
+    assert line.rect.collidepoint(play.io.screen.convert_pos(50, 25))
+    assert not line.rect.collidepoint(play.io.screen.convert_pos(-100, -100))
+
+    # the line is drawn where it is, at its own thickness
+    pygame_x, pygame_y = play.io.screen.convert_pos(50, 25)
+    local = (int(pygame_x) - line.rect.x, int(pygame_y) - line.rect.y)
+    assert line.image.get_at(local)[3] > 0
+
+
+def test_line_moving_by_fractions_shares_surfaces():
+    """A line moving by fractions of a pixel doesn't fill the surface cache."""
+    import play
+
+    line = play.new_line(x=0, y=0, x1=80, y1=40, thickness=3)
+    play.surface_cache.clear()
+    for step in range(120):
+        line.x, line.y = step * 0.13, step * 0.07
+        line.x1, line.y1 = 80 + step * 0.13, 40 + step * 0.07
+        line.update()
+
+    assert play.surface_cache.info()["entries"] <= 8
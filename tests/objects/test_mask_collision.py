@@ -0,0 +1,122 @@
+"""Tests for checking if sprites touch with masks of their pixels."""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_circles_with_touching_rects_but_not_pixels():
+    import play
+
+    a = play.new_circle(x=0, y=0, radius=20)
+    b = play.new_circle(x=30, y=30, radius=20)
+    c = play.new_circle(x=25, y=0, radius=20)
+    play.step_frames(1)
+
+    assert a.is_touching(b)
+    assert not a.is_touching(b, collision="mask")
+    assert a.is_touching(c, collision="mask")
+
+    far = play.new_circle(x=300, y=0, radius=20)
+    play.step_frames(1)
+    assert not a.is_touching(far, collision="mask")
+
+
+def test_point_touching_a_mask():
+    import play
+
+    circle = play.new_circle(x=0, y=0, radius=20)
+    play.step_frames(1)
+    corner = play.screen.width / 2 - 19, play.screen.height / 2 - 19
+
+    assert circle.is_touching(corner)
+    assert not circle.is_touching(corner, collision="mask")
+
+
+def test_point_touching_a_hidden_sprite():
+    import play
+
+    box = play.new_box(x=0, y=0, width=50, height=50)
+    play.step_frames(1)
+    center = play.screen.width / 2, play.screen.height / 2
+    assert box.is_touching(center, collision="mask")
+
+    box.hide()
+    play.step_frames(1)
+    assert not box.is_touching(center, collision="mask")
+
+
+def test_masks_are_kept_until_the_image_changes():
+    import play
+
+    box = play.new_box(x=0, y=0, width=40, height=20)
+    other = play.new_box(x=10, y=0, width=40, height=20)
+    play.step_frames(1)
+
+    mask = box._get_mask()
+    assert box.is_touching(other, collision="mask")
+    box.x = 5
+    play.step_frames(1)
+    assert box._get_mask() is mask
+
+    box.angle = 45
+    play.step_frames(1)
+    assert box._get_mask() is not mask
+
+
+def test_when_touching_with_masks():
+    import play
+
+    a = play.new_circle(x=0, y=0, radius=20)
+    b = play.new_circle(x=30, y=30, radius=20)
+    group = play.new_group(b)
+    touches = []
+
+    @a.when_touching(b, collision="mask")
+    def touching_sprite():
+        touches.append("sprite")
+
+    @a.when_touching(group, collision="mask")
+    def touching_group():
+        touches.append("group")
+
+    play.step_frames(2)
+    assert not touches
+
+    a.go_to(10, 10)
+    play.step_frames(1)
+    assert sorted(touches) == ["group", "sprite"]
+
+
+def test_mask_when_touching_before_start_physics():
+    import play
+
+    a = play.new_circle(x=0, y=0, radius=20)
+    b = play.new_circle(x=30, y=30, radius=20)
+    touches = []
+
+    @a.when_touching(b, collision="mask")
+    def touching():
+        touches.append(play.frame_count())
+
+    a.start_physics(obeys_gravity=False, can_move=False)
+    play.step_frames(2)
+    assert not touches
+
+    a.go_to(10, 10)
+    play.step_frames(1)
+    assert touches
+
+
+def test_unknown_collision():
+    import play
+
+    a = play.new_box()
+    with pytest.raises(ValueError, match="mask"):
+        a.is_touching(play.new_box(), collision="pixels")
+    with pytest.raises(ValueError, match="mask"):
+        a.when_touching(play.new_box(), collision="pixels")
@@ -0,0 +1,97 @@
+"""Tests for sprite batches, many sprites of the same shape stored in arrays."""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def _pixel(x, y):
+    import play
+
+    pos = play.io.screen.convert_pos(x, y)
+    return tuple(play.globals.globals_list.display.get_at((int(pos[0]), int(pos[1]))))[
+        :3
+    ]
+
+
+def _close(color, expected):
+    return all(abs(a - b) <= 2 for a, b in zip(color, expected))
+
+
+def test_batch_arrays():
+    import play
+
+    batch = play.new_sprite_batch("circle", count=1000, radius=2)
+
+    assert len(batch) == 1000
+    assert batch.x.shape == (1000,)
+    assert batch.colors.shape == (1000, 3)
+
+    batch.x = np.arange(1000)
+    batch.vx = 60
+    batch.x += batch.vx * 0.5
+    assert batch.x[10] == pytest.approx(40)
+
+    batch.move(1)
+    assert batch.x[10] == pytest.approx(100)
+
+
+def test_batch_is_drawn():
+    import play
+
+    batch = play.new_sprite_batch("box", count=3, width=10, height=10, color="red")
+    batch.x = [-100, 0, 100]
+    batch.colors[2] = (0, 0, 255)
+    batch.visible[1] = False
+    play.step_frames(1)
+
+    assert _close(_pixel(-100, 0), (255, 0, 0))
+    assert _pixel(0, 0) == (255, 255, 255)
+    assert _close(_pixel(100, 0), (0, 0, 255))
+    assert play.stats.counts["batch_sprites_drawn"] == 2
+
+
+def test_batch_shares_surfaces():
+    import play
+
+    play.surface_cache.clear()
+    batch = play.new_sprite_batch("circle", count=10000, radius=3, color="green")
+    batch.x = np.random.uniform(-400, 400, 10000)
+    play.step_frames(3)
+
+    assert play.surface_cache.misses == 1
+
+
+def test_removed_batch_is_not_drawn():
+    import play
+
+    batch = play.new_sprite_batch("box", count=1, color="red")
+    batch.remove()
+    play.step_frames(1)
+
+    assert _pixel(0, 0) == (255, 255, 255)
+
+
+def test_batch_with_dirty_renderer():
+    import play
+
+    play.set_renderer("dirty")
+    batch = play.new_sprite_batch("box", count=1, width=10, height=10, color="red")
+    play.step_frames(1)
+    batch.x = 100
+    play.step_frames(1)
+
+    assert _pixel(0, 0) == (255, 255, 255)
+    assert _close(_pixel(100, 0), (255, 0, 0))
+
+
+def test_unknown_batch_shape():
+    import play
+
+    with pytest.raises(ValueError):
+        play.new_sprite_batch("triangle")
@@ -302,3 +302,72 @@ def test_sprite_transparency_invalid():
 
     with pytest.raises(ValueError):
         sprite.transparency = "not a number"
+
+
+def test_moving_sprite_keeps_its_image():
+    """Moving a sprite only moves its rect, it doesn't draw its image again."""
+    import play
+
+    for sprite in (play.new_box(), play.new_circle(), play.new_text("hi")):
+        image = sprite.image
+        sprite.move(10)
+        sprite.go_to(50, 60)
+        sprite.update()
+
+        assert sprite.image is image
+        assert sprite.rect.center == pytest.approx(
+            play.io.screen.convert_pos(50, 60), abs=1
+        )
+
+
+def test_turning_sprite_keeps_its_drawing():
+    """Turning a box turns the image it already drew, changing its color draws it again."""
+    import play
+
+    box = play.new_box(width=50, height=20)
+    base_image = box._base_image
+    box.turn(90)
+    box.update()
+
+    assert box._base_image is base_image
+    assert box.image.get_size() == (20, 50)
+
+    box.color = "red"
+    box.update()
+    assert box._base_image is not base_image
+
+
+def test_writing_the_same_value_doesnt_update_the_sprite():
+    """Only writes that change a value mark the sprite and its dependents for an update."""
+    import play
+
+    box = play.new_box(color="red")
+    other = play.new_circle()
+
+    @other.when_touching(box)
+    def touching():
+        pass
+
+    box.update()
+    other.update()
+
+    box.color = "red"
+    box.x = box.x
+    assert not (box._should_recompute or box._should_move or other._should_move)
+
+    box.x += 10
+    assert box._should_move and not box._should_recompute
+    assert other._should_move and not other._should_recompute
+
+
+def test_sprite_attributes_are_slotted():
+    """The attributes of play's sprites live in slots, not in a __dict__."""
+    import play
+
+    for sprite in (play.new_box(), play.new_circle(), play.new_text("hi")):
+        assert not vars(sprite)
+
+    # users can still add attributes of their own
+    box = play.new_box()
+    box.speed = 3
+    assert vars(box) == {"speed": 3}
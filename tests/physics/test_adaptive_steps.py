@@ -0,0 +1,49 @@
+"""Tests for the adaptive number of physics simulation steps."""
+
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_slow_scene_uses_one_step():
+    """Nothing fast on screen means a single simulation step."""
+    import play
+    from play.core.physics_loop import choose_sim_steps
+
+    ball = play.new_circle(radius=20)
+    ball.start_physics(obeys_gravity=False, x_speed=30)
+    play.set_adaptive_physics_steps(max_steps=10)
+
+    assert choose_sim_steps(1 / 60) == 1
+
+
+def test_fast_projectile_uses_more_steps():
+    """A small, fast body gets more steps, up to the ceiling."""
+    import play
+    from play.core.physics_loop import choose_sim_steps
+
+    bullet = play.new_circle(radius=2)
+    bullet.start_physics(obeys_gravity=False, x_speed=1200)
+    play.set_adaptive_physics_steps(max_steps=8)
+
+    # 1200 px/s moves 20 px per frame, the bullet is 4 px wide
+    assert choose_sim_steps(1 / 60) == 8
+
+    play.set_adaptive_physics_steps(max_steps=50)
+    assert choose_sim_steps(1 / 60) == 10
+
+
+def test_adaptive_steps_in_game_loop():
+    """The game loop reports the number of steps it used."""
+    import play
+
+    ball = play.new_circle(radius=20)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+    play.set_adaptive_physics_steps()
+
+    play.step_frames(10)
+
+    assert play.stats.counts["physics_steps"] == 1
+    assert round(ball.x) == 10
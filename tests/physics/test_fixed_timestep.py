@@ -0,0 +1,72 @@
+"""Tests for the fixed timestep physics mode."""
+
+import pytest
+import sys
+
+sys.path.insert(0, ".")
+
+
+def test_fixed_timestep_catches_up():
+    """A long frame is simulated as several constant physics ticks."""
+    import play
+    from play.core.physics_loop import simulate_fixed_physics, fixed_timestep_state
+    from play.loop import loop
+
+    ball = play.new_circle(radius=10)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+    play.set_fixed_timestep(physics_rate=60, max_steps_per_frame=5)
+
+    ticks = loop.run_until_complete(simulate_fixed_physics(3.5 / 60))
+
+    assert ticks == 3
+    assert abs(fixed_timestep_state.accumulator - 0.5 / 60) < 1e-9
+    assert abs(ball.physics._pymunk_body.position.x - 3) < 0.01
+
+
+def test_fixed_timestep_carries_remainder():
+    """Frames shorter than a tick are accumulated until a tick is due."""
+    import play
+    from play.core.physics_loop import simulate_fixed_physics
+    from play.loop import loop
+
+    play.set_fixed_timestep(physics_rate=30)
+
+    assert loop.run_until_complete(simulate_fixed_physics(1 / 60)) == 0
+    assert loop.run_until_complete(simulate_fixed_physics(1 / 60)) == 1
+
+
+def test_fixed_timestep_caps_catch_up_ticks():
+    """The number of ticks per frame is capped and the backlog is dropped."""
+    import play
+    from play.core.physics_loop import simulate_fixed_physics, fixed_timestep_state
+    from play.loop import loop
+
+    play.set_fixed_timestep(physics_rate=60, max_steps_per_frame=4)
+
+    assert loop.run_until_complete(simulate_fixed_physics(1.0)) == 4
+    assert fixed_timestep_state.accumulator < 1 / 60
+
+
+def test_fixed_timestep_invalid_rate():
+    """A physics rate of zero is rejected."""
+    import play
+
+    with pytest.raises(ValueError):
+        play.set_fixed_timestep(physics_rate=0)
+
+
+def test_fixed_timestep_forgets_time_when_changed():
+    """Time left over from before the mode changed isn't caught up on."""
+    import play
+    from play.core.physics_loop import simulate_fixed_physics, fixed_timestep_state
+    from play.loop import loop
+
+    play.set_fixed_timestep(physics_rate=60)
+    loop.run_until_complete(simulate_fixed_physics(0.9 / 60))
+    assert fixed_timestep_state.accumulator > 0
+
+    play.set_fixed_timestep(enabled=False)
+    assert fixed_timestep_state.accumulator == 0
+
+    play.set_fixed_timestep(physics_rate=60)
+    assert loop.run_until_complete(simulate_fixed_physics(0.5 / 60)) == 0
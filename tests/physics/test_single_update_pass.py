@@ -0,0 +1,109 @@
+"""Tests that sprites are updated once per frame, however many physics steps it has."""
+
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_physics_sprite_is_updated_once_per_frame():
+    """Physics steps don't update sprites, the sprites phase does it once."""
+    import play
+
+    play.set_physics_simulation_steps(10)
+    ball = play.new_box(width=10, height=10)
+    ball.start_physics(obeys_gravity=False, x_speed=60)
+    ball.physics._pymunk_body.angular_velocity = 1
+
+    updates = []
+    update = ball.update
+    ball.update = lambda: updates.append(play.frame_count()) or update()
+    play.step_frames(10)
+
+    assert updates == list(range(10))
+    assert play.stats.counts["physics_steps"] == 10
+    assert play.stats.counts["sprites_rerendered"] == 0
+    assert round(ball.x) == 10
+
+
+def test_short_collision_runs_touching_callbacks_once():
+    """A collision that begins and ends within one frame runs its callback once."""
+    import play
+
+    play.set_physics_simulation_steps(10)
+    ball = play.new_circle(radius=5, x=0)
+    wall = play.new_box(width=10, height=100, x=40)
+    # fast enough to hit the wall and bounce off it during a single frame
+    ball.start_physics(obeys_gravity=False, x_speed=1800, bounciness=1.0)
+    wall.start_physics(obeys_gravity=False, can_move=False, bounciness=1.0)
+
+    touches = []
+    stops = []
+
+    @ball.when_touching(wall)
+    def touching():
+        touches.append(ball.is_touching(wall))
+
+    @ball.when_stopped_touching(wall)
+    def stopped():
+        stops.append(play.frame_count())
+
+    play.step_frames(3)
+
+    assert touches == [True]
+    assert len(stops) == 1
+    assert ball.physics.x_speed < 0
+
+
+def test_repeated_collision_runs_touching_callback_once_per_frame():
+    """A collision that begins several times within one frame runs its callback once."""
+    import play
+
+    play.set_physics_simulation_steps(10)
+    ball = play.new_circle(radius=5, x=0)
+    left_wall = play.new_box(width=10, height=100, x=-15)
+    right_wall = play.new_box(width=10, height=100, x=15)
+    # fast enough to bounce between the walls several times during a single frame
+    ball.start_physics(obeys_gravity=False, x_speed=3000, bounciness=1.0)
+    left_wall.start_physics(obeys_gravity=False, can_move=False, bounciness=1.0)
+    right_wall.start_physics(obeys_gravity=False, can_move=False, bounciness=1.0)
+
+    touches = []
+
+    @ball.when_touching(right_wall)
+    def touching():
+        touches.append(play.frame_count())
+
+    play.step_frames(3)
+
+    assert touches
+    assert len(touches) == len(set(touches))
+
+
+def test_collisions_with_two_sprites_in_one_frame_run_both_callbacks():
+    """Two collisions that begin in the same frame both run their callback."""
+    import play
+
+    play.set_physics_simulation_steps(10)
+    ball = play.new_circle(radius=5, x=0)
+    left_wall = play.new_box(width=10, height=100, x=-15)
+    right_wall = play.new_box(width=10, height=100, x=15)
+    # fast enough to hit both walls during every frame
+    ball.start_physics(obeys_gravity=False, x_speed=3000, bounciness=1.0)
+    left_wall.start_physics(obeys_gravity=False, can_move=False, bounciness=1.0)
+    right_wall.start_physics(obeys_gravity=False, can_move=False, bounciness=1.0)
+
+    touches = {"left": [], "right": []}
+
+    @ball.when_touching(left_wall)
+    def touching_left():
+        touches["left"].append(play.frame_count())
+
+    @ball.when_touching(right_wall)
+    def touching_right():
+        touches["right"].append(play.frame_count())
+
+    play.step_frames(6)
+
+    assert touches == {"left": list(range(6)), "right": list(range(6))}
@@ -48,9 +48,11 @@ def test_ball_movement():
 
     play.start_program()
 
-    if not (num_collisions_decorator == 2 and method_check_inside_decorator == 2):
+    # the ball bounces off the box once, and touching events run once per frame
+    # instead of once per physics step
+    if not (num_collisions_decorator == 1 and method_check_inside_decorator == 1):
         pytest.fail(
-            f"expected two collisions by the method and the decorator, but found {num_collisions_decorator}, {method_check_inside_decorator}"
+            f"expected one collision by the method and the decorator, but found {num_collisions_decorator}, {method_check_inside_decorator}"
         )
 
 
@@ -0,0 +1,80 @@
+"""Tests for the grid that finds the sprites near a sprite."""
+
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_grid_finds_sprites_in_the_same_cells():
+    import pygame
+    from play.utils.spatial_grid import SpatialGrid
+
+    grid = SpatialGrid(cell_size=100)
+    grid.move("a", pygame.Rect(10, 10, 20, 20))
+    grid.move("b", pygame.Rect(90, 10, 20, 20))
+    grid.move("c", pygame.Rect(500, 500, 20, 20))
+
+    assert grid.query(pygame.Rect(0, 0, 50, 50)) == {"a", "b"}
+    assert grid.query(pygame.Rect(150, 10, 10, 10)) == {"b"}
+    assert grid.query(pygame.Rect(-300, -300, 10, 10)) == set()
+    assert grid.info() == {"sprites": 3, "cells": 3}
+
+
+def test_grid_moves_and_removes_sprites():
+    import pygame
+    from play.utils.spatial_grid import SpatialGrid
+
+    grid = SpatialGrid(cell_size=100)
+    grid.move("a", pygame.Rect(10, 10, 20, 20))
+    grid.move("a", pygame.Rect(310, 10, 20, 20))
+    assert grid.query(pygame.Rect(0, 0, 50, 50)) == set()
+    assert grid.query(pygame.Rect(300, 0, 50, 50)) == {"a"}
+
+    grid.remove("a")
+    assert grid.query(pygame.Rect(300, 0, 50, 50)) == set()
+    assert grid.info() == {"sprites": 0, "cells": 0}
+
+
+def test_disabled_grid_finds_every_sprite():
+    import pygame
+    from play.utils.spatial_grid import SpatialGrid
+
+    grid = SpatialGrid()
+    grid.enabled = False
+    assert "anything" in grid.query(pygame.Rect(0, 0, 10, 10))
+
+
+def test_sprites_keep_their_place_in_the_grid():
+    import play
+    from play.utils.spatial_grid import sprite_grid
+
+    box = play.new_box(x=0, y=0, width=20, height=20)
+    assert box in sprite_grid.query(box.rect)
+
+    box.x = 300
+    box.update()
+    assert box in sprite_grid.query(box.rect)
+    assert box not in sprite_grid.query(play.new_box(x=-300, y=0, width=20).rect)
+
+    box.remove()
+    assert box not in sprite_grid.query(box.rect)
+
+
+def test_touching_one_of_many_sprites():
+    import play
+
+    player = play.new_box(x=0, y=0, width=20, height=20)
+    coins = [play.new_circle(x=-380 + 40 * i, y=250, radius=5) for i in range(20)] + [
+        play.new_circle(x=0, y=0, radius=5)
+    ]
+    touched = []
+
+    @player.when_touching(*coins)
+    def touching():
+        touched.append(play.frame_count())
+
+    player.x += 1
+    play.step_frames(1)
+    assert touched == [0]
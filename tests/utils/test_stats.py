@@ -0,0 +1,83 @@
+"""Tests for the frame timing surface, play.stats."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_percentiles():
+    """Percentiles are computed over the recorded samples, in milliseconds."""
+    from play.utils.stats import FrameStats
+
+    stats = FrameStats()
+    for i in range(1, 101):
+        stats.record("physics", i / 1000)
+
+    assert stats.percentile("physics", 50) == pytest.approx(50)
+    assert stats.percentile("physics", 95) == pytest.approx(95)
+    assert stats.percentiles("physics")["p99"] == pytest.approx(99)
+    assert stats.mean("physics") == pytest.approx(50.5)
+    assert stats.percentile("flip", 50) is None
+
+
+def test_rolling_window():
+    """Only the most recent samples are kept."""
+    from play.utils.stats import FrameStats
+
+    stats = FrameStats(window=10)
+    for _ in range(10):
+        stats.record("flip", 1.0)
+    for _ in range(10):
+        stats.record("flip", 0.001)
+
+    assert stats.percentile("flip", 100) == pytest.approx(1)
+
+
+def test_counts_per_frame():
+    """Counters are published at the end of each frame and then reset."""
+    from play.utils.stats import FrameStats
+
+    stats = FrameStats()
+    stats.count("sprites_rerendered", 3)
+    stats.end_frame()
+    assert stats.counts["sprites_rerendered"] == 3
+
+    stats.end_frame()
+    assert stats.counts["sprites_rerendered"] == 0
+
+
+def test_published_counts_dont_change():
+    """The counts of a frame stay the same while the next frame is counted."""
+    from play.utils.stats import FrameStats
+
+    stats = FrameStats()
+    stats.count("sprites_rerendered", 3)
+    stats.end_frame()
+    counts = stats.counts
+
+    stats.count("sprites_rerendered", 5)
+    assert counts["sprites_rerendered"] == 3
+    stats.end_frame()
+    assert counts["sprites_rerendered"] == 3
+    assert stats.counts["sprites_rerendered"] == 5
+
+
+def test_game_loop_records_phases():
+    """Running frames records every phase of the game loop."""
+    import play
+
+    play.new_box()
+    ball = play.new_circle()
+    ball.start_physics()
+
+    play.step_frames(5)
+
+    for phase in ("events", "keyboard", "repeat_forever", "physics", "flip", "frame"):
+        assert phase in play.stats.phases
+    assert play.stats.percentiles("frame")["p50"] is not None
+    # the box didn't change, only the falling ball is updated
+    assert play.stats.counts["sprites_updated"] == 1
+    assert play.stats.counts["physics_bodies"] == 1
@@ -0,0 +1,113 @@
+"""Tests for the cache of rendered surfaces shared between sprites."""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, ".")
+os.environ.setdefault("PLAY_HEADLESS", "1")
+
+
+def test_identical_sprites_share_a_surface():
+    import play
+
+    play.surface_cache.clear()
+    circles = [play.new_circle(color="red", radius=10) for _ in range(100)]
+
+    assert all(circle.image is circles[0].image for circle in circles)
+    assert play.surface_cache.misses == 1
+    assert play.surface_cache.hits == 99
+    assert play.surface_cache.hit_rate == pytest.approx(0.99)
+
+
+def test_different_sprites_dont_share_a_surface():
+    import play
+
+    red = play.new_box(color="red")
+    blue = play.new_box(color="blue")
+    faded = play.new_box(color="red", transparency=50)
+    text = play.new_text("hi")
+    other_text = play.new_text("hello")
+
+    assert red.image is not blue.image
+    assert red.image is not faded.image
+    assert text.image is not other_text.image
+
+
+def test_changing_a_sprite_doesnt_change_the_others():
+    import play
+
+    first = play.new_circle(color="red", radius=10)
+    second = play.new_circle(color="red", radius=10)
+    second.color = "blue"
+    second.update()
+
+    assert first.image is not second.image
+    assert tuple(first.image.get_at((10, 10)))[:3] == (255, 0, 0)
+
+
+def test_cache_is_bounded():
+    from play.utils.surface_cache import SurfaceCache
+    import pygame
+
+    cache = SurfaceCache(max_bytes=10 * 10 * 4 * 2)
+    for size in range(3):
+        cache.get(("square", size), lambda: pygame.Surface((10, 10), pygame.SRCALPHA))
+
+    assert cache.info()["entries"] == 2
+    assert cache.evictions == 1
+    assert cache.bytes <= cache.max_bytes
+
+    cache.set_max_bytes(0)
+    assert cache.info()["entries"] == 0
+    assert cache.bytes == 0
+
+    with pytest.raises(ValueError):
+        cache.set_max_bytes(-1)
+
+
+def test_rotated_surfaces_are_shared():
+    import play
+
+    play.surface_cache.angle_step = 5
+    first = play.new_box(angle=44)
+    second = play.new_box(angle=46)
+
+    assert first.image is second.image
+
+
+def test_rotated_surfaces_dont_keep_their_base_alive():
+    from play.utils.surface_cache import SurfaceCache
+    import gc
+    import weakref
+    import pygame
+
+    cache = SurfaceCache()
+    base = cache.get(("square",), lambda: pygame.Surface((10, 10), pygame.SRCALPHA))
+    turned = cache.rotate(("square",), base, 45)
+    dropped = weakref.ref(base)
+
+    # the base surface is the least recently used, so it's the one dropped
+    cache.set_max_bytes(cache.bytes)
+    cache.get(("dot",), lambda: pygame.Surface((1, 1), pygame.SRCALPHA))
+    del base
+    gc.collect()
+
+    assert cache.evictions == 1
+    assert dropped() is None
+    assert cache.rotate(("square",), None, 45) is turned
+
+
+def test_unturned_boxes_use_their_drawing():
+    import play
+
+    play.surface_cache.clear()
+    box = play.new_box(angle=0)
+
+    assert box.image is box._base_image
+    assert play.surface_cache.info()["entries"] == 1
+
+    box.angle = 360
+    box.update()
+    assert box.image is box._base_image
+    assert play.surface_cache.info()["entries"] == 1